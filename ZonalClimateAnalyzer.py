@@ -3,32 +3,43 @@ from __future__ import annotations
 
 from pathlib import Path
 from itertools import chain
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from urllib.parse import urlparse
-from typing import Iterable
+from typing import TYPE_CHECKING, Iterable
 import argparse
+import functools
+import io
 import json
 import logging
+import multiprocessing
 import os
+import re
 import shutil
 import zipfile
 import gzip
 import filetype
 from tqdm import tqdm
-import pandas as pd
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # Optional, json is used as fallback.
+    orjson = None
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
-from bs4 import BeautifulSoup
 
-import geopandas as gpd
-import rasterio
-from rasterio.crs import CRS
-from rasterstats import zonal_stats
+# geopandas, rasterio, pandas and matplotlib.figure load GDAL, PROJ and fonts on import.
+# They are imported inside the functions that need them to keep the start fast
+# (here only for the type annotations).
+if TYPE_CHECKING:
+    import geopandas as gpd
+    from rasterio.crs import CRS
+    from rasterio.windows import Window
 
 import matplotlib
 matplotlib.use("Agg")  # Use a non-GUI backend. Prevents QSocketNotifier.
-import matplotlib.pyplot as plt
 
 LOGGER = logging.getLogger("zca")
 
@@ -38,10 +49,21 @@ DATA_INFO_DIR = BASE_DIR / "data_info"
 OUTPUT_DIR = BASE_DIR / "output"
 SHP_DIR = BASE_DIR / "shp"
 PRJ_FILE = BASE_DIR / "gk3.prj"
+MANIFEST_NAME = ".manifest.json"
+# Vectorized OGR bindings, much faster than fiona's per-feature iteration
+GEO_IO_ENGINE = "pyogrio"
+# GDAL configuration of every raster open (one block cache per worker process, no .aux.xml sidecars)
+GDAL_ENV = {"GDAL_CACHEMAX": 256, "GDAL_PAM_ENABLED": "NO"}
 
 DWD_BASE_URL = "https://opendata.dwd.de/climate_environment/CDC/grids_germany/annual/"
 DEFAULT_TIMEOUT = 30
 USER_AGENT = "ZonalClimateAnalyzer/1.0"
+# Links in the Apache directory listings of the DWD open data server
+_HREF_RE = re.compile(r'href="([^"]+)"', re.IGNORECASE)
+# Parallel downloads (network bound, threads sharing the pooled session)
+DOWNLOAD_WORKERS = max(1, int(os.environ.get("ZCA_DOWNLOAD_WORKERS", "16")))
+LISTING_WORKERS = 8
+COPY_BUFFER_SIZE = 1024 * 1024
 
 # Plot styling to match the web UI theme
 PLOT_COLORS = {
@@ -75,7 +97,10 @@ matplotlib.rcParams.update({
     "grid.alpha": 0.6,
     "font.size": 11.5,
     "legend.frameon": False,
-    "legend.labelcolor": "#e7edf4"
+    "legend.labelcolor": "#e7edf4",
+    # Merge line segments that deviate less than half a pixel when the paths are drawn
+    "path.simplify": True,
+    "path.simplify_threshold": 0.5
 })
 
 PLOT_TEXT = {
@@ -156,6 +181,14 @@ def t(key: str) -> str:
     return PLOT_TEXT.get(LANG, PLOT_TEXT["de"]).get(key, PLOT_TEXT["de"].get(key, key))
 
 
+# Day of the year each month starts (month ticks of the vegetation plot)
+_MONTH_DAYS = (0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334)
+_MONTH_LABELS = {
+    "de": ("Jan", "Feb", "Mär", "Apr", "Mai", "Jun", "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"),
+    "en": ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"),
+}
+
+
 # In[2]:
 
 
@@ -179,8 +212,10 @@ def check_crs(shapefile: str) -> bool:
     Returns False if it die NOT have a valid CRS.
     '''
 
+    import geopandas as gpd
+
     # Load the shapefile
-    gdf = gpd.read_file(shapefile)
+    gdf = gpd.read_file(shapefile, engine=GEO_IO_ENGINE)
 
     # Check if CRS is defined
     valid_crs = gdf.crs
@@ -204,6 +239,8 @@ def get_shp() -> Path:
     Returns path to the shapefile if Valid shp and CRS are found.
     '''
 
+    import geopandas as gpd
+
     print('\n'+'#'*64)
     print('\nThis Program lets you analyze the climate history of any area within Germany.')
     print('You only need a shapefile defining the area you want to analyze.')
@@ -215,7 +252,7 @@ def get_shp() -> Path:
         # If the input is a file path
         if shp_path.is_file() and shp_path.suffix.lower() == '.shp':
             try:
-                gdf = gpd.read_file(shp_path)
+                gdf = gpd.read_file(shp_path, engine=GEO_IO_ENGINE)
                 if gdf.crs:
                     print('Valid shapefile with valid CRS found.')
                     return shp_path
@@ -253,20 +290,46 @@ def check_if_already_downloaded(raster_links: list[str], raster_dir: Path) -> bo
 
     # Folder where files might be saved
     # Return False if folder is empty
-    if not raster_dir.exists() or not any(raster_dir.iterdir()):
+    if not raster_dir.exists():
         return False
-    tif_names = {f.stem for f in raster_dir.glob("*.tif")}
+    with os.scandir(raster_dir) as it:
+        tif_names = {e.name[:-4] for e in it if e.name.endswith(".tif")}
     if not tif_names:
         return False
 
-    expected = set()
-    for link in raster_links:
-        name = Path(urlparse(link).path).name
-        expected.add(Path(rename_dwd_file(name)).stem)
+    # Reuse the expected names of the last download if the DWD links did not change
+    expected = None
+    try:
+        manifest = json.loads((raster_dir / MANIFEST_NAME).read_text(encoding="utf-8"))
+        if manifest.get("links") == list(raster_links):
+            expected = set(manifest["stems"])
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    if expected is None:
+        expected = _expected_raster_stems(raster_links)
 
     return expected.issubset(tif_names)
 
 
+def _expected_raster_stems(raster_links: list[str]) -> set[str]:
+    """
+    Returns the names (without ending) of the .tif files created from raster_links.
+    """
+    return {Path(rename_dwd_file(Path(urlparse(link).path).name)).stem for link in raster_links}
+
+
+def write_download_manifest(raster_links: list[str], raster_dir: Path) -> None:
+    """
+    Saves raster_links and the expected .tif names next to the rasters,
+    so check_if_already_downloaded does not have to derive them again on the next start.
+    """
+    manifest = {
+        "links": list(raster_links),
+        "stems": sorted(_expected_raster_stems(raster_links)),
+    }
+    (raster_dir / MANIFEST_NAME).write_text(json.dumps(manifest), encoding="utf-8")
+
+
 def local_raster_ready(raster_dir: Path) -> bool:
     """
     Returns True when local raster data appears to be present.
@@ -292,7 +355,13 @@ def _build_session() -> requests.Session:
         status_forcelist=(429, 500, 502, 503, 504),
         allowed_methods=("GET",),
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    # All requests go to the same host: keep enough pooled connections for every download and listing worker.
+    pool_size = max(DOWNLOAD_WORKERS, LISTING_WORKERS)
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=retry,
+    )
     session = requests.Session()
     session.mount("https://", adapter)
     session.mount("http://", adapter)
@@ -300,6 +369,34 @@ def _build_session() -> requests.Session:
     return session
 
 
+def _list_folder(
+    session: requests.Session,
+    location: str,
+    file_types: tuple[str, ...],
+    timeout: int = DEFAULT_TIMEOUT,
+) -> list[str]:
+    """
+    Returns the absolute links of all files in the DWD folder listing at location ending with file_types.
+    """
+
+    response = session.get(location, timeout=timeout)
+    if response.status_code != 200:
+        raise RuntimeError(f"\nFailed to retrieve the webpage: {location}")
+
+    # Build absolute URLs
+    hrefs = _HREF_RE.findall(response.text)
+    if not hrefs:
+        # Fall back to a full HTML parser if the listing format ever changes
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(response.text, 'html.parser')
+        hrefs = [a['href'] for a in soup.find_all('a', href=True)]
+    return [
+        location + href
+        for href in hrefs
+        if href.lower().endswith(file_types)
+    ]
+
+
 def list_of_dwd_data(
     session: requests.Session,
     file_types: Iterable[str] = (".asc.gz", ".pdf", ".zip"),
@@ -340,22 +437,12 @@ def list_of_dwd_data(
     ]
     download_locations = [base_download_location+f for f in folder_download_locations]
 
-    # Create a list containing all links
-    links = []
-    for location in download_locations:
-        response = session.get(location, timeout=timeout)
-        if response.status_code != 200:
-            raise RuntimeError(f"\nFailed to retrieve the webpage: {location}")
-
-        soup = BeautifulSoup(response.text, 'html.parser')
-
-        # Build absolute URLs
-        found = [
-            location + a['href']
-            for a in soup.find_all('a', href=True)
-            if a['href'].lower().endswith(tuple(file_types))
-        ]
-        links.append(found)
+    # Fetch the folder listings concurrently (same host, pooled connections), keeping their order
+    with ThreadPoolExecutor(max_workers=LISTING_WORKERS) as ex:
+        links = list(ex.map(
+            functools.partial(_list_folder, session, file_types=tuple(file_types), timeout=timeout),
+            download_locations,
+        ))
 
     links_flattend = list(chain.from_iterable(links))
 
@@ -365,6 +452,31 @@ def list_of_dwd_data(
 # In[7]:
 
 
+def _download_one(
+    session: requests.Session,
+    file_url: str,
+    file_path: Path,
+    timeout: int = DEFAULT_TIMEOUT,
+) -> bool:
+    """
+    Streams a single file to file_path.
+    Writes to a temporary .part file first, so an existing file_path is always complete.
+    Returns True if the download succeeded.
+    """
+
+    part_path = file_path.with_name(file_path.name + ".part")
+    with session.get(file_url, stream=True, timeout=timeout) as r:
+        if r.status_code != 200:
+            LOGGER.warning("Download failed (%s): %s", r.status_code, file_url)
+            return False
+        with part_path.open('wb') as f:
+            for chunk in r.iter_content(chunk_size=8192):
+                if chunk:
+                    f.write(chunk)
+    part_path.replace(file_path)
+    return True
+
+
 def download_dwd_data(
     session: requests.Session,
     links: list[str],
@@ -373,6 +485,7 @@ def download_dwd_data(
 ) -> None:
     """
     Download files from a list of full URLs into a target directory.
+    Files that already exist in the target directory are skipped.
     Parameters:
         links (list[str]): List of full download URLs.
         dest_dir (str or Path): Local directory where the files will be saved.
@@ -383,21 +496,25 @@ def download_dwd_data(
 
     dest_dir.mkdir(parents=True, exist_ok=True)
 
-    for file_url in tqdm(links,
-                     desc='',
-                     bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Downloading files.',
-                     ncols=120):
-        filename = Path(urlparse(file_url).path).name
-        file_path = dest_dir / filename
-
-        with session.get(file_url, stream=True, timeout=timeout) as r:
-            if r.status_code != 200:
-                LOGGER.warning("Download failed (%s): %s", r.status_code, file_url)
-                continue
-            with file_path.open('wb') as f:
-                for chunk in r.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+    # Skip files that are already on disk (resume an interrupted download)
+    pending = {}
+    for file_url in links:
+        file_path = dest_dir / Path(urlparse(file_url).path).name
+        if not file_path.exists():
+            pending[file_url] = file_path
+
+    # Downloads are network bound: share the session's connection pool between threads
+    with ThreadPoolExecutor(max_workers=DOWNLOAD_WORKERS) as ex:
+        futures = [
+            ex.submit(_download_one, session, file_url, file_path, timeout)
+            for file_url, file_path in pending.items()
+        ]
+        for future in tqdm(as_completed(futures),
+                           total=len(futures),
+                           desc='',
+                           bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Downloading files.',
+                           ncols=120):
+            future.result()
 
 
 # # Process the Data
@@ -418,13 +535,13 @@ def list_of_files(folder: Path, file_type: str = ".gz") -> list[str]:
     if not folder.exists():
         return []
 
-    files = sorted(
-        [
-            str(f)
-            for f in folder.iterdir()
-            if f.is_file() and "".join(f.suffixes).lower().endswith(file_type.lower())
-        ]
-    )
+    file_type = file_type.lower()
+    with os.scandir(folder) as it:
+        files = sorted(
+            e.path
+            for e in it
+            if e.name.lower().endswith(file_type) and e.is_file()
+        )
     return files
 
 
@@ -455,9 +572,32 @@ def rename_dwd_file(file: str) -> str:
 # In[10]:
 
 
+def _unzip_asc(path: Path, decompressed_file: Path) -> None:
+    """
+    Extracts the first .asc member of the ZIP archive path to decompressed_file.
+    """
+    with zipfile.ZipFile(path) as zf:
+        asc_members = [m for m in zf.namelist() if m.lower().endswith(".asc")]
+        if not asc_members:
+            raise ValueError("No .asc file found in archive.")
+        with zf.open(asc_members[0]) as src, decompressed_file.open("wb") as dst:
+            shutil.copyfileobj(src, dst, length=COPY_BUFFER_SIZE)
+
+
+def _gunzip(path: Path, decompressed_file: Path) -> None:
+    """
+    Decompresses the gzip file path to decompressed_file.
+    """
+    with gzip.open(path, mode="rb") as f_in:
+        with decompressed_file.open(mode="wb") as f_out:
+            shutil.copyfileobj(f_in, f_out, length=COPY_BUFFER_SIZE)
+
+
 def decompress_file(file: str) -> str:
     """
     Decompress files and saves a copy in the same folder.
+    The format is taken from the file ending (the filenames come from the DWD urls),
+    the file content is only sniffed for unknown endings.
     Args:
         file (str): path to file (input file)
     Return:
@@ -465,30 +605,34 @@ def decompress_file(file: str) -> str:
     """
 
     path = Path(file)
-    ft = filetype.guess(file)
-    ft_ext = ft.extension if ft else None
+    suffix = path.suffix.lower()
 
-    if path.suffix.lower() in {".asc", ".tif"} or ft_ext in {"asc", "tif"}:
+    if suffix in {".asc", ".tif"}:
         LOGGER.info("Filetype is already %s, no decompression needed", path.suffix)
         return str(path)
 
     # Keep output alongside the source file instead of the current working directory.
     decompressed_file = path.with_name(rename_dwd_file(path.name))
 
-    # Unpack the mis-labelled “…asc.gz” archive (which is really a ZIP)
-    if zipfile.is_zipfile(path) or ft_ext == "zip" or path.suffix.lower() == ".zip":
-        with zipfile.ZipFile(path) as zf:
-            asc_members = [m for m in zf.namelist() if m.lower().endswith(".asc")]
-            if not asc_members:
-                raise ValueError("No .asc file found in archive.")
-            with zf.open(asc_members[0]) as src, decompressed_file.open("wb") as dst:
-                dst.write(src.read())
-        return str(decompressed_file)
-
-    # Default to gzip if .gz or unknown data that isn't a zip
-    with gzip.open(path, mode="rb") as f_in:
-        with decompressed_file.open(mode="wb") as f_out:
-            shutil.copyfileobj(f_in, f_out)
+    if suffix == ".zip":
+        _unzip_asc(path, decompressed_file)
+    elif suffix == ".gz":
+        try:
+            _gunzip(path, decompressed_file)
+        except gzip.BadGzipFile:
+            # Unpack the mis-labelled “…asc.gz” archive (which is really a ZIP)
+            _unzip_asc(path, decompressed_file)
+    else:
+        ft = filetype.guess(file)
+        ft_ext = ft.extension if ft else None
+        if ft_ext in {"asc", "tif"}:
+            LOGGER.info("Filetype is already %s, no decompression needed", ft_ext)
+            return str(path)
+        # Default to gzip if unknown data that isn't a zip
+        if ft_ext == "zip" or zipfile.is_zipfile(path):
+            _unzip_asc(path, decompressed_file)
+        else:
+            _gunzip(path, decompressed_file)
 
     return str(decompressed_file)
 
@@ -496,44 +640,115 @@ def decompress_file(file: str) -> str:
 # In[11]:
 
 
-def asc_to_tif_add_crs(asc_input: str, prj_txt: str) -> str:
+@functools.lru_cache(maxsize=None)
+def _load_wkt(prj_txt: str) -> str:
     """
-    Takes asc_input, adds crs (from prj.txt), saves it as .tif in the same folder.
-    Args:
-        asc_input (str): path to asc file (input file)
-        prj_txt (str): path to prj file (text file that contains projection information)
-    Returns:
-        tif_output (tif): path/to/output.tif file
+    Reads the projection information from prj_txt once per run.
+    """
+    with open(prj_txt, "r", encoding="utf-8") as f:
+        return f.read()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_crs(prj_txt: str) -> CRS:
+    """
+    Parses the CRS of prj_txt once per run.
+    """
+
+    from rasterio.crs import CRS
+
+    return CRS.from_wkt(_load_wkt(prj_txt))
+
+
+def _compact_dtype(data: np.ndarray, nodata) -> str:
+    """
+    Returns the smallest dtype that stores data (and nodata) without loss.
+    Integral values within the int16 range (counts of days, 1/10 °C, mm) are stored as int16,
+    other integers keep their dtype, everything else is stored as float32.
+    """
+
+    if data.size == 0:
+        return "float32"
+
+    is_int = np.issubdtype(data.dtype, np.integer)
+    integral = is_int or bool(np.array_equal(data, np.trunc(data)))
+    if nodata is not None and not float(nodata).is_integer():
+        integral = False
+
+    if integral:
+        lo, hi = data.min(), data.max()
+        if nodata is not None:
+            lo, hi = min(lo, nodata), max(hi, nodata)
+        limits = np.iinfo(np.int16)
+        if limits.min <= lo and hi <= limits.max:
+            return "int16"
+        if is_int:
+            return data.dtype.name
+
+    return "float32"
+
+
+def _write_tif(asc_input: str, data: np.ndarray, profile: dict, prj_txt: str) -> str:
     """
+    Writes data read from asc_input as .tif with the crs from prj_txt into the same folder.
+    Returns path to the .tif file.
+    """
+
+    import rasterio
 
     # CRS from .prj_file
-    with open(prj_txt, "r", encoding="utf-8") as f:
-        wkt = f.read()
-    crs = CRS.from_wkt(wkt)
+    crs = _load_crs(prj_txt)
 
-    # Read the .asc file
-    with rasterio.open(asc_input) as src:
-        data = src.read(1)
-        profile = src.profile
+    # Keep integer grids as integers instead of upcasting everything to float32
+    dtype = _compact_dtype(data, profile.get("nodata"))
 
     # Update Profile with CRS
+    profile = dict(profile)
+    # Tiled layout so windowed reads only decode the tiles around the area,
+    # horizontal differencing (floating point for float grids) shrinks the smooth climate grids.
     profile.update({
         "driver": "GTiff",
         "crs": crs,
-        "dtype": rasterio.float32,
+        "dtype": dtype,
         "compress": "lzw",
+        "predictor": 3 if dtype == "float32" else 2,
+        "tiled": True,
+        "blockxsize": 256,
+        "blockysize": 256,
     })
 
     tif_output = asc_input.replace(".asc", "") + ".tif"
 
-    # Write to a new GeoTIFF file with CRS assigned
-    with rasterio.open(tif_output, 'w', **profile) as dst:
-        dst.write(data.astype(rasterio.float32), 1)
+    # Write to a new GeoTIFF file with CRS assigned.
+    # Always the full grid: the .tif files are the raster cache shared by every analysed area,
+    # only the zonal stats are restricted to the window around the area (see zonal_window_mask).
+    with rasterio.Env(**GDAL_ENV), rasterio.open(tif_output, 'w', **profile) as dst:
+        dst.write(data.astype(dtype, copy=False), 1)
 
     #print(f'asc_to_tif_add_crs: Successfully transformed \n"{asc_input}" to \n"{tif_output}" \nand added {crs}.\n')
     return tif_output
 
 
+def asc_to_tif_add_crs(asc_input: str, prj_txt: str) -> str:
+    """
+    Takes asc_input, adds crs (from prj.txt), saves it as .tif in the same folder.
+    Args:
+        asc_input (str): path to asc file (input file)
+        prj_txt (str): path to prj file (text file that contains projection information)
+    Returns:
+        tif_output (tif): path/to/output.tif file
+    """
+
+    import rasterio
+
+    # Read the .asc file
+    with rasterio.Env(**GDAL_ENV), rasterio.open(asc_input) as src:
+        data = src.read(1)
+        profile = src.profile
+
+    return _write_tif(asc_input, data, profile, prj_txt)
+
+
 # In[12]:
 
 
@@ -544,14 +759,15 @@ def delete_raster_files(folder_path: str) -> None:
         folder_path (str): Path to folder containing the files.
     """
 
-    folder = Path(folder_path)
-    patterns = ["*.asc", "*.asc.gz", "*.zip"]
     deleted_files = 0
 
-    for pattern in patterns:
-        for file in folder.glob(pattern):
+    # One directory pass, dispatch by ending
+    with os.scandir(folder_path) as it:
+        for e in it:
+            if not e.name.lower().endswith((".asc", ".asc.gz", ".zip")) or not e.is_file():
+                continue
             try:
-                file.unlink()
+                os.unlink(e.path)
             except OSError:
                 continue
             deleted_files += 1
@@ -564,6 +780,9 @@ def _coerce_gdf_for_shapefile(gdf: gpd.GeoDataFrame) -> gpd.GeoDataFrame:
     """
     Converts pandas StringDtype columns to object dtype for shapefile writing.
     """
+
+    import pandas as pd
+
     gdf = gdf.copy()
     for col in gdf.columns:
         if col == gdf.geometry.name:
@@ -577,20 +796,20 @@ def change_shp_crs(shp_input: str, prj_txt: str) -> str:
     """
     Takes shp_input, transforms to crs (from prj.txt), outputs as shp_output
     Args:
-        shp_input (str): path to shp file (input file)
+        shp_input (str): path to shp file (input file, a GeoPackage works as well)
         prj_txt (str): path to prj file (text file that contains projection information)
     
     Returns:
         shp_output (str): path/to/output.tif file
     """
 
+    import geopandas as gpd
+
     # CRS from .prj_file
-    with open(prj_txt, "r", encoding="utf-8") as f:
-        wkt = f.read()
-    target_crs = CRS.from_wkt(wkt)
+    target_crs = _load_crs(prj_txt)
 
     # Read Shapefile
-    gdf = gpd.read_file(shp_input)
+    gdf = gpd.read_file(shp_input, engine=GEO_IO_ENGINE)
 
     # Check if CRS is defined
     if gdf.crs is None:
@@ -604,10 +823,10 @@ def change_shp_crs(shp_input: str, prj_txt: str) -> str:
     SHP_DIR.mkdir(parents=True, exist_ok=True)
 
     # Define output name
-    shp_output = str(SHP_DIR / Path(str(shp_input).replace(".shp", "") + "_" + str(target_crs).replace(":", "") + ".shp").name)
+    shp_output = str(SHP_DIR / (Path(shp_input).stem + "_" + str(target_crs).replace(":", "") + ".shp"))
 
     # Save transformed shp to shp_output
-    gdf_transformed.to_file(shp_output, encoding='utf-8')
+    gdf_transformed.to_file(shp_output, encoding='utf-8', engine=GEO_IO_ENGINE)
 
     #print(f'change_shp_crs: Successfully copied \n"{shp_input}" to \n"{shp_output}" \nand added {target_crs}.\n')
     return shp_output
@@ -625,21 +844,25 @@ def dissolve_shp(shp_input: str) -> str:
         shp_output (str): path/to/output.tif file
     """
 
+    import geopandas as gpd
+    import shapely
+
     # Read Shapefile
-    gdf = gpd.read_file(shp_input)
+    gdf = gpd.read_file(shp_input, engine=GEO_IO_ENGINE)
 
-    # Dissolve features in gdf
-    gdf_dissolved = gdf.dissolve()
-    gdf_dissolved = _coerce_gdf_for_shapefile(gdf_dissolved)
+    # Dissolve features in gdf (only the merged geometry is needed for the zonal stats,
+    # a direct union skips the groupby and attribute aggregation of gdf.dissolve())
+    merged = shapely.union_all(gdf.geometry.values)
+    gdf_dissolved = gpd.GeoDataFrame(geometry=[merged], crs=gdf.crs)
 
     # Create Output Folder
     SHP_DIR.mkdir(parents=True, exist_ok=True)
 
     # Define output name
-    shp_output = str(SHP_DIR / Path(str(shp_input).replace(".shp", "") + "_dissolved" + ".shp").name)
+    shp_output = str(SHP_DIR / (Path(shp_input).stem + "_dissolved" + ".shp"))
 
     # Save transformed shp to shp_output
-    gdf_dissolved.to_file(shp_output, encoding='utf-8')
+    gdf_dissolved.to_file(shp_output, encoding='utf-8', engine=GEO_IO_ENGINE)
 
     return shp_output
 
@@ -647,20 +870,143 @@ def dissolve_shp(shp_input: str) -> str:
 # In[15]:
 
 
-def calculate_zonal_stats(shp: str, tif: str) -> list[dict]:
+def zonal_window_mask(geoms: list, transform, width: int, height: int) -> tuple[Window, np.ndarray]:
     """
-    Calculates zonal stats of the tif for each feature in the shp.
+    Computes the raster window covering the geometries and a mask of the cells outside of them.
     Args:
-        shp (str): path to shp file
-        tif (str): path to tif file
+        geoms (list): shapely geometries in the CRS of the raster
+        transform (Affine): transform of the raster grid
+        width (int), height (int): size of the raster grid
     Returns:
-        stats (list[dict]): list of dictionarys which contain min, max, mean and count of the raster data for each poly.
+        window (Window): smallest window of the grid containing the bounds of geoms
+        outside (np.ndarray): boolean array in the shape of window, True for cells outside of geoms
     """
 
+    from rasterio.features import geometry_mask
+    from rasterio.windows import Window, from_bounds
+    from rasterio.windows import transform as window_transform
+
+    minx = min(g.bounds[0] for g in geoms)
+    miny = min(g.bounds[1] for g in geoms)
+    maxx = max(g.bounds[2] for g in geoms)
+    maxy = max(g.bounds[3] for g in geoms)
+    bbox = from_bounds(minx, miny, maxx, maxy, transform=transform)
+
+    # Snap outwards to whole cells (plus one cell for all_touched) and clip to the grid.
+    col_start = max(int(np.floor(bbox.col_off)) - 1, 0)
+    row_start = max(int(np.floor(bbox.row_off)) - 1, 0)
+    col_stop = min(int(np.ceil(bbox.col_off + bbox.width)) + 1, width)
+    row_stop = min(int(np.ceil(bbox.row_off + bbox.height)) + 1, height)
+    window = Window(col_start, row_start, max(col_stop - col_start, 0), max(row_stop - row_start, 0))
+    if window.width == 0 or window.height == 0:
+        return window, np.ones((int(window.height), int(window.width)), dtype=bool)
+
     # Set all_touched to False if you want to include only raster-cells that are completely within the shapefile.
-    stats = zonal_stats(shp, tif, all_touched=True)
+    outside = geometry_mask(
+        geoms,
+        out_shape=(int(window.height), int(window.width)),
+        transform=window_transform(window, transform),
+        all_touched=True,
+    )
+    return window, outside
+
 
-    return stats
+def calculate_zonal_stats(data: np.ndarray, outside: np.ndarray, nodata=None) -> list[dict]:
+    """
+    Calculates zonal stats of the raster data for the cells not covered by the mask.
+    Args:
+        data (np.ndarray): raster data of the window (see zonal_window_mask)
+        outside (np.ndarray): boolean mask in the shape of data, True for cells to ignore
+        nodata (float, optional): nodata value of the raster, these cells are ignored as well
+    Returns:
+        stats (list[dict]): list with one dictionary which contains min, max, mean and count of the raster data.
+    """
+
+    # Plain boolean indexing, no masked arrays
+    valid = ~outside
+    if nodata is not None:
+        valid &= ~np.isnan(data) if np.isnan(nodata) else data != nodata
+    values = data[valid]
+
+    count = int(values.size)
+    if count == 0:
+        return [{"min": None, "max": None, "mean": None, "count": 0}]
+
+    return [{
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "mean": float(values.mean(dtype=np.float64)),
+        "count": count,
+    }]
+
+
+# Geometries and cached masks of the worker processes (see _init_zonal_worker)
+_WORKER_GEOMS = []
+_WORKER_MASKS = {}
+
+
+def _init_zonal_worker(geoms: list, masks: dict | None = None) -> None:
+    """
+    Initializer of the worker processes, receives the geometries (and already computed masks)
+    once per process instead of once per file.
+    """
+    global _WORKER_GEOMS
+    _WORKER_GEOMS = geoms
+    _WORKER_MASKS.clear()
+    if masks:
+        _WORKER_MASKS.update(masks)
+
+
+def _worker_window_mask(transform, width: int, height: int) -> tuple[Window, np.ndarray]:
+    """
+    Returns the window and mask of the worker geometries for the grid, computed once per grid.
+    """
+    grid = (transform, width, height)
+    if grid not in _WORKER_MASKS:
+        _WORKER_MASKS[grid] = zonal_window_mask(_WORKER_GEOMS, *grid)
+    return _WORKER_MASKS[grid]
+
+
+def tif_zonal_stats(tif: str) -> list[dict]:
+    """
+    Calculates the zonal stats of the worker geometries with a windowed read of tif.
+    Args:
+        tif (str): path to tif file
+    Returns:
+        stats (list[dict]): zonal stats (see calculate_zonal_stats)
+    """
+
+    import rasterio
+
+    with rasterio.Env(**GDAL_ENV), rasterio.open(tif) as src:
+        window, outside = _worker_window_mask(src.transform, src.width, src.height)
+        return calculate_zonal_stats(src.read(1, window=window), outside, src.nodata)
+
+
+def asc_to_tif_zonal_stats(asc_input: str, prj_txt: str) -> tuple[str, list[dict]]:
+    """
+    Same as asc_to_tif_add_crs, but also calculates the zonal stats of the worker geometries
+    from the grid that is already in memory, so the new .tif does not have to be read again.
+    Args:
+        asc_input (str): path to asc file (input file)
+        prj_txt (str): path to prj file (text file that contains projection information)
+    Returns:
+        tif_output (str): path/to/output.tif file
+        stats (list[dict]): zonal stats (see calculate_zonal_stats)
+    """
+
+    import rasterio
+
+    # Read the .asc file
+    with rasterio.Env(**GDAL_ENV), rasterio.open(asc_input) as src:
+        data = src.read(1)
+        profile = src.profile
+
+    window, outside = _worker_window_mask(profile["transform"], profile["width"], profile["height"])
+
+    stats = calculate_zonal_stats(data[window.toslices()], outside, profile.get("nodata"))
+
+    return _write_tif(asc_input, data, profile, prj_txt), stats
 
 
 # In[16]:
@@ -674,12 +1020,15 @@ def zonal_climate_analysis(shp_input: str, raster_folder: str, prj_file: str) ->
         raster_folder (str): path to folder containing all raster files to perform the rasterstats calculations with. has to be in .asc.gz file format
         prj_txt (str): path to prj file (text file that contains projection information)
     Creates:
-        rasterstats_dict (dict{str:[{}]}): dict containing the name of the raster file as key and the corresponding rasterstats as a list of dicts as values.
+        rasterstats_json (dict{str:{str:[{}]}}): dict containing the name of the raster as key and a dict of the years and the corresponding rasterstats as a list of dicts as values.
     Returns:
         json_output_path_name (str): path to the created json file conatining rasterstats calculations.
         shp_crs_dissolved (str): path to the dissolved shapefile with transformed crs the rasterstats where calculated on.
     """
 
+    import geopandas as gpd
+    import rasterio
+
     raster_folder = Path(raster_folder)
 
     # Prepare shapefile:
@@ -690,25 +1039,40 @@ def zonal_climate_analysis(shp_input: str, raster_folder: str, prj_file: str) ->
     files_asc_gz = list_of_files(raster_folder, file_type=".asc.gz")
 
     if len(files_asc_gz) != 0:
-        # Decompress rasterfiles:
-        for f in tqdm(files_asc_gz,
+        # Decompress rasterfiles (independent files, one process per core):
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+            list(tqdm(ex.map(decompress_file, files_asc_gz),
+                      total=len(files_asc_gz),
                       desc='',
                       bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Decompressing files.',
-                      ncols=120):
-            decompress_file(f)
+                      ncols=120))
     else:
         print('Files are already decompressed.')
 
+    # Geometries of the dissolved shapefile (already in the CRS of the rasters):
+    geoms = [g for g in gpd.read_file(shp_crs_dissolved, engine=GEO_IO_ENGINE).geometry if g is not None and not g.is_empty]
+    if not geoms:
+        raise ValueError("Shapefile contains no valid geometries.")
+
+    # Rasterstats of every .tif rasterfile:
+    rasterstats_by_file = {}
+
     # Create list of decompressed .asc rasterfiles:
     files_asc = list_of_files(raster_folder, file_type=".asc")
 
     if len(files_asc) != 0:
-        # Transform decompressed files to tif and add crs:
-        for f in tqdm(files_asc,
-                      desc='',
-                      bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Transforming files to the right format.',
-                      ncols=120):
-            asc_to_tif_add_crs(f, prj_file)
+        # Transform decompressed files to tif and add crs (processes, rasterio is not thread safe).
+        # The rasterstats are calculated from the grid in memory, so the new .tif files are not read again.
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_init_zonal_worker,
+                                 initargs=(geoms,)) as ex:
+            results = ex.map(functools.partial(asc_to_tif_zonal_stats, prj_txt=prj_file), files_asc)
+            for tif, stats in tqdm(results,
+                                   total=len(files_asc),
+                                   desc='',
+                                   bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Transforming files to the right format.',
+                                   ncols=120):
+                rasterstats_by_file[tif] = stats
     else:
         print('Files are already transformed to the right format.')
 
@@ -717,43 +1081,48 @@ def zonal_climate_analysis(shp_input: str, raster_folder: str, prj_file: str) ->
     if not files_tif:
         raise RuntimeError("No .tif files found after preprocessing.")
 
-    # Create list containing rasterstats:
-    rasterstats_list = []
-
-    # Iterate over files_tif and perform rasterstats calculations on each rasterfile and the shapefile:
-    for f in tqdm(files_tif,
-                  desc='',
-                  bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Calculating rasterstats.',
-                  ncols=120):
-        rasterstats_list.append(calculate_zonal_stats(shp_crs_dissolved, f)) # Append rasterstats to rasterstats_list
-
-    # Combine rasterstats and the name of the raster the stats are calculated with
-    raster_path = str(raster_folder)
-    filenames = [Path(fn).with_suffix('').name for fn in files_tif]
+    # Iterate over the remaining files_tif and perform rasterstats calculations on each rasterfile and the shapefile:
+    files_pending = [f for f in files_tif if f not in rasterstats_by_file]
+
+    if files_pending:
+        # The DWD rasters share their grid: compute the window and mask once here
+        # and hand them to every worker process with the initializer (not with every file).
+        with rasterio.Env(**GDAL_ENV), rasterio.open(files_pending[0]) as src:
+            grid = (src.transform, src.width, src.height)
+        masks = {grid: zonal_window_mask(geoms, *grid)}
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count(),
+                                 initializer=_init_zonal_worker,
+                                 initargs=(geoms, masks)) as ex:
+            results = ex.map(tif_zonal_stats, files_pending, chunksize=8)
+            for f, stats in tqdm(zip(files_pending, results),
+                                 total=len(files_pending),
+                                 desc='',
+                                 bar_format='{l_bar}{bar:40}| ({n_fmt}/{total_fmt}) Calculating rasterstats.',
+                                 ncols=120):
+                rasterstats_by_file[f] = stats
 
     # Delete deprecated files
-    delete_raster_files(raster_path)
-
-    # Create dict
-    rasterstats_dict = dict(zip(filenames, rasterstats_list))
+    delete_raster_files(str(raster_folder))
 
-    # Convert rasterstats_dict to better json format:
+    # Nest the rasterstats by the name and year of the raster ({name}_{year}.tif) in one pass:
     rasterstats_json = {}
 
-    for key, value in rasterstats_dict.items():
-        name = key[:-5]
-        year = key[-4:]
-        if name not in rasterstats_json:
-            rasterstats_json[name] = {}
-        rasterstats_json[name][year] = value
+    for f in files_tif:
+        stem = Path(f).stem
+        name, year = stem[:-5], stem[-4:]
+        rasterstats_json.setdefault(name, {})[year] = rasterstats_by_file.pop(f)
 
     # Export dict as json:
     path_to_shp = Path(shp_crs_dissolved)
     shp_name = path_to_shp.name
     json_output_path_name = str(OUTPUT_DIR / (shp_name.replace(".shp", "") + "_rasterstats.json"))
 
-    with open(json_output_path_name, "w", encoding="utf-8") as rs_json:
-        json.dump(rasterstats_json, rs_json)
+    if orjson is not None:
+        Path(json_output_path_name).write_bytes(orjson.dumps(rasterstats_json, option=orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(json_output_path_name, "w", encoding="utf-8") as rs_json:
+            json.dump(rasterstats_json, rs_json)
 
     return json_output_path_name, shp_crs_dissolved
 
@@ -763,57 +1132,64 @@ def zonal_climate_analysis(shp_input: str, raster_folder: str, prj_file: str) ->
 # In[17]:
 
 
-def years_values(rs_data: dict, parameter_name: str):
+# Parameters (keys in the rasterstats json) used by the plots
+PLOT_KEYS = (
+    "air_temp_max",
+    "air_temp_mean",
+    "air_temp_min",
+    "frost_days",
+    "ice_days",
+    "snowcover_days",
+    "summer_days",
+    "hot_days",
+    "precipitation",
+    "drought_index",
+    "precipGE10mm_days",
+    "precipGE20mm_days",
+    "precipGE30mm_days",
+    "sunshine_duration",
+    "vegetation_begin",
+    "vegetation_end",
+)
+
+
+def years_values(rs_data: dict, parameter_name: str, stats: tuple[str, ...] = ("mean",)):
     """
     Arguments:
         parameter_name (str): key in rasterstats.json dictionary
+        stats (tuple[str]): statistics to extract ("min", "max", "mean", "count"), only the mean by default
     Returns:
-        title (str): parameter_name
-        years (list): list of years
-        values_max (list): list of max values
-        values_mean (list): list of mean values
-        values_min (list): list of min values
+        years (np.ndarray): array of years (int)
+        one array (float32) per requested statistic, in the order of stats
     """
 
-    # Title:
-    title = parameter_name
-
-    # Years:
-    years = sorted(rs_data[title], key=lambda y: int(y))
+    # Years (keys in the json, converted to int once):
+    keys = sorted(rs_data[parameter_name], key=int)
+    years = np.fromiter(map(int, keys), dtype=int, count=len(keys))
 
-    # Values max:
-    values_max = []
-    for year in (rs_data[parameter_name][y] for y in years):
-        for entry in year:
-            values_max.append(entry['max'])
+    # Requested statistics in one pass (one row per entry):
+    values = np.fromiter(
+        (entry[k] for y in keys for entry in rs_data[parameter_name][y] for k in stats),
+        dtype=np.float32,
+    ).reshape(-1, len(stats))
 
-    # Values mean:
-    values_mean = []
-    for year in (rs_data[parameter_name][y] for y in years):
-        for entry in year:
-            values_mean.append(entry['mean'])
-
-    # Values mean:
-    values_min = []
-    for year in (rs_data[parameter_name][y] for y in years):
-        for entry in year:
-            values_min.append(entry['min'])
-
-    return title, years, values_max, values_mean, values_min
+    return (years, *values.T)
 
 
 # In[18]:
 
 
-def create_map(shapefile: str, shp_name: str) -> None:
+def create_map(shapefile: str, shp_name: str) -> str:
     '''
     Takes path to shapefile as string as input.
     Creates interactive map as html.
     Adds area and perimeter as tooltips on hover in the html map.
     '''
 
+    import geopandas as gpd
+
     shp_path = Path(shapefile)
-    gdf = gpd.read_file(shapefile)
+    gdf = gpd.read_file(shapefile, engine=GEO_IO_ENGINE)
     if gdf.crs is None:
         raise ValueError("CRS is missing. Set a CRS before running.")
 
@@ -832,32 +1208,53 @@ def create_map(shapefile: str, shp_name: str) -> None:
 
     # Save Map
     mapname = shp_name + "_" + "map.html"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    map_path = str(OUTPUT_DIR / mapname)
-    m.save(map_path)
+    map_path = OUTPUT_DIR / mapname
+    # Written to a .part file and renamed, like the plots, so an existing map is replaced and not rewritten
+    part_path = OUTPUT_DIR / (mapname + ".part")
+    m.save(str(part_path))
+    part_path.replace(map_path)
     print(f'Successfully created and saved map: {mapname}')
+    return str(map_path)
 
 
 # In[19]:
 
+_FIGURE = None
+
+
+def _subplots():
+    """
+    Returns a figure with a single, cleared Axes. The Figure is created directly (Agg canvas) instead of
+    through pyplot, once per process, and reused by every plot (secondary axes like twinx are removed).
+    The figure-level style (size, background, margins) is the same for every plot and only set once here,
+    ax.clear() resets the Axes, so apply_plot_style styles them for every plot.
+    """
+    global _FIGURE
+    if _FIGURE is None:
+        from matplotlib.figure import Figure
+        _FIGURE = Figure(figsize=(12, 6.6))
+        _FIGURE.patch.set_facecolor(PLOT_COLORS["sand"])
+        _FIGURE.subplots_adjust(top=0.86, right=0.98, left=0.08, bottom=0.22)
+        _FIGURE.subplots()
+    ax, *extra_axes = _FIGURE.axes
+    for extra in extra_axes:
+        extra.remove()
+    ax.clear()
+    return _FIGURE, ax
+
+
 def apply_plot_style(fig, ax, years, y_label, y_max=None, y_min=0, title=None):
-    fig.set_size_inches(12, 6.6)
-    fig.patch.set_facecolor(PLOT_COLORS["sand"])
     ax.set_facecolor(PLOT_COLORS["panel"])
     ax.set_xlabel(t("year"), labelpad=10)
     ax.set_ylabel(y_label, labelpad=10)
     if title:
         ax.set_title(title, fontsize=14, pad=12, fontweight="semibold")
-    year_ints = None
-    if years:
-        ax.set_xlim([min(years), max(years)])
-        try:
-            year_ints = [int(y) for y in years]
-            tick_years = [str(y) for y in year_ints if y % 5 == 0]
-            if tick_years:
-                ax.set_xticks(tick_years)
-        except ValueError:
-            pass
+    if len(years):
+        years = np.asarray(years, dtype=int)
+        ax.set_xlim([years.min(), years.max()])
+        tick_years = years[years % 5 == 0]
+        if tick_years.size:
+            ax.set_xticks(tick_years, labels=[str(y) for y in tick_years])
         ax.tick_params(axis='x', rotation=35)
     if y_max is not None:
         ax.set_ylim([y_min, y_max])
@@ -867,69 +1264,97 @@ def apply_plot_style(fig, ax, years, y_label, y_max=None, y_min=0, title=None):
     ax.spines["right"].set_visible(False)
     ax.spines["left"].set_color(PLOT_COLORS["grid"])
     ax.spines["bottom"].set_color(PLOT_COLORS["grid"])
-    fig.subplots_adjust(top=0.86, right=0.98, left=0.08, bottom=0.22)
 
 
-def style_legend(ax):
-    handles, labels = ax.get_legend_handles_labels()
+def plot_lines(ax, x, lines, colors, labels):
+    """
+    Draws every y in lines over x as one LineCollection (instead of one Line2D per line).
+    Returns proxy handles for the legend, the collection itself has a single legend entry.
+    """
+    from matplotlib.collections import LineCollection
+    from matplotlib.lines import Line2D
+
+    ax.add_collection(LineCollection(
+        [np.column_stack([x, y]) for y in lines],
+        colors=colors,
+        linewidths=2.2,
+        joinstyle="round",
+        capstyle="projecting",
+    ))
+    return [Line2D([], [], color=c, linewidth=2.2, label=l) for c, l in zip(colors, labels)]
+
+
+# Legend below the axes, same style for every plot
+_LEGEND_KW = {
+    "loc": "upper center",
+    "bbox_to_anchor": (0.5, -0.16),
+    "frameon": True,
+    "handlelength": 2.4,
+    "columnspacing": 1.2,
+    "borderaxespad": 0.6,
+    "facecolor": PLOT_COLORS["panel"],
+    "edgecolor": PLOT_COLORS["grid"],
+    "framealpha": 1.0,
+}
+
+
+def style_legend(ax, handles=None):
+    if handles is None:
+        handles, labels = ax.get_legend_handles_labels()
+    else:
+        labels = [h.get_label() for h in handles]
     if not handles:
         return
-    cols = min(len(labels), 3)
-    legend = ax.legend(
-        loc="upper center",
-        bbox_to_anchor=(0.5, -0.16),
-        ncol=cols,
-        frameon=True,
-        handlelength=2.4,
-        columnspacing=1.2,
-        borderaxespad=0.6
-    )
-    legend.get_frame().set_facecolor(PLOT_COLORS["panel"])
-    legend.get_frame().set_edgecolor(PLOT_COLORS["grid"])
+    legend = ax.legend(handles, labels, ncol=min(len(labels), 3), **_LEGEND_KW)
     legend.get_frame().set_linewidth(0.8)
-    legend.get_frame().set_alpha(1.0)
 
 
 def save_plot(fig, plot_path):
-    fig.savefig(plot_path, bbox_inches='tight', dpi=300, facecolor=fig.get_facecolor())
+    # zlib level 1 instead of 6: much faster to encode, barely larger for flat-coloured line plots.
+    # No "Software" text chunk in the PNG.
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", bbox_inches='tight', dpi=300, facecolor=fig.get_facecolor(),
+                metadata={"Software": None}, pil_kwargs={"compress_level": 1})
+
+    # Render in memory, then write a .part file and rename it, so plot_path is never a half-written PNG
+    plot_path = Path(plot_path)
+    part_path = plot_path.with_name(plot_path.name + ".part")
+    part_path.write_bytes(buffer.getbuffer())
+    part_path.replace(plot_path)
 
 
-def plot_air_temp_min_mean_max(rs_data: dict, shp_name: str):
+def plot_air_temp_min_mean_max(series: dict, shp_name: str):
     # Air Temp min mean max
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
-
-    # List oft startyears
-    startyears = []
+    fig, ax = _subplots()
 
     # Max Temp
-    title, years, values_max, t_max, values_min = years_values(rs_data, "air_temp_max")
-    t_max = [t_max[i]/10 for i in range(len(t_max))]                            # 1/10 so it is in degrees noch in degrees/10
-    startyears.append(years[0])
+    years_max, t_max = series["air_temp_max"]
+    t_max = t_max / 10                                                          # 1/10 so it is in degrees noch in degrees/10
 
     # Mean Temp
-    title, years, values_max, t_mean, values_min = years_values(rs_data, "air_temp_mean")
-    t_mean = [t_mean[i]/10 for i in range(len(t_mean))]
-    startyears.append(years[0])
+    years_mean, t_mean = series["air_temp_mean"]
+    t_mean = t_mean / 10
 
     # Min Temp
-    title, years, values_max, t_min, values_min = years_values(rs_data, "air_temp_min")
-    t_min = [t_min[i]/10 for i in range(len(t_min))]
-    startyears.append(years[0])
+    years, t_min = series["air_temp_min"]
+    t_min = t_min / 10
 
-    # Crop to the same start-year
-    common_startyear = int(max(startyears))
-    years_filtered = [y for y in years if int(y) >= common_startyear]
-    t_max  = [v for y, v in zip(map(int, years), t_max)  if y >= common_startyear]
-    t_mean = [v for y, v in zip(map(int, years), t_mean) if y >= common_startyear]
-    t_min  = [v for y, v in zip(map(int, years), t_min)  if y >= common_startyear]
+    # Crop to the years all three series have (boolean mask per series)
+    years_filtered = np.intersect1d(np.intersect1d(years_max, years_mean), years)
+    t_max  = t_max[np.isin(years_max, years_filtered)]
+    t_mean = t_mean[np.isin(years_mean, years_filtered)]
+    t_min  = t_min[np.isin(years, years_filtered)]
 
     # Plot
-    ax.plot(years_filtered, t_max, color=PLOT_COLORS["coral"], linewidth=2.2, label=t("air_temp_max"))
-    ax.plot(years_filtered, t_mean, color=PLOT_COLORS["mint"], linewidth=2.2, label=t("air_temp_mean"))
-    ax.plot(years_filtered, t_min, color=PLOT_COLORS["ice"], linewidth=2.2, label=t("air_temp_min"))
+    handles = plot_lines(
+        ax,
+        years_filtered,
+        [t_max, t_mean, t_min],
+        [PLOT_COLORS["coral"], PLOT_COLORS["mint"], PLOT_COLORS["ice"]],
+        [t("air_temp_max"), t("air_temp_mean"), t("air_temp_min")],
+    )
 
     # Fill between lines
     ax.fill_between(years_filtered, t_max, t_mean, color=PLOT_COLORS["coral"], alpha=0.18)
@@ -940,40 +1365,36 @@ def plot_air_temp_min_mean_max(rs_data: dict, shp_name: str):
         ax,
         years_filtered,
         t("temp_c"),
-        max(t_max) * 1.2,
+        t_max.max() * 1.2,
         title=t("air_temp_title")
     )
-    style_legend(ax)
+    style_legend(ax, handles)
 
     # Save Plot
     plotname = shp_name + "_" + "lufttemperatur_min_mittel_max.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[20]:
 
 
-def plot_frost_ice_days(rs_data: dict, shp_name: str):
+def plot_frost_ice_days(series: dict, shp_name: str):
     # Frost and Ice Days
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Ice Days
-    title, years, values_max, values_mean_id, values_min = years_values(rs_data, "ice_days")
+    years, values_mean_id = series["ice_days"]
 
     # Frost Days
-    title, years, values_max, values_mean_fd, values_min = years_values(rs_data, "frost_days")
-
-    # List containing 365 (days per year) as many times as there are years (upper limit)
-    days_in_year_max = [365]*len(years)
+    years, values_mean_fd = series["frost_days"]
 
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    # Lower limit (0 days) for every year
+    days_in_year_min = np.zeros(len(years))
 
     # Plot
     ax.plot(years, values_mean_fd, color=PLOT_COLORS["ice"], linewidth=2.2, label=t("frost_days"))
@@ -988,37 +1409,33 @@ def plot_frost_ice_days(rs_data: dict, shp_name: str):
         ax,
         years,
         t("days"),
-        max(values_mean_fd) * 1.2,
+        values_mean_fd.max() * 1.2,
         title=t("frost_ice_title")
     )
     style_legend(ax)
 
     # Save Plot
     plotname = shp_name + "_" + "frost_eistage.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[21]:
 
 
-def plot_snowcover_days(rs_data: dict, shp_name: str):
+def plot_snowcover_days(series: dict, shp_name: str):
     # Snowcover Days
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Snowcover Days
-    title, years, values_max, values_mean_snd, values_min = years_values(rs_data, "snowcover_days")
-
-    # List containing 365 (days per year) as many times as there are years (upper limit)
-    days_in_year_max = [365]*len(years)
+    years, values_mean_snd = series["snowcover_days"]
 
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    # Lower limit (0 days) for every year
+    days_in_year_min = np.zeros(len(years))
 
     # Plot
     ax.plot(years, values_mean_snd, color=PLOT_COLORS["ice"], linewidth=2.2, label=t("snowcover_days"))
@@ -1031,40 +1448,36 @@ def plot_snowcover_days(rs_data: dict, shp_name: str):
         ax,
         years,
         t("days"),
-        max(values_mean_snd) * 1.2,
+        values_mean_snd.max() * 1.2,
         title=t("snowcover_title")
     )
     style_legend(ax)
 
     # Save Plot
     plotname = shp_name + "_" + "schneedeckentage.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[22]:
 
 
-def plot_summer_hot_days(rs_data: dict, shp_name: str):
+def plot_summer_hot_days(series: dict, shp_name: str):
     # Summer and Hot Days
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Ice Days
-    title, years, values_max, values_mean_sd, values_min = years_values(rs_data, "summer_days")
+    years, values_mean_sd = series["summer_days"]
 
     # Frost Days
-    title, years, values_max, values_mean_hd, values_min = years_values(rs_data, "hot_days")
-
-    # List containing 365 (days per year) as many times as there are years (upper limit)
-    days_in_year_max = [365]*len(years)
+    years, values_mean_hd = series["hot_days"]
 
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    # Lower limit (0 days) for every year
+    days_in_year_min = np.zeros(len(years))
 
     # Plot
     ax.plot(years, values_mean_sd, color=PLOT_COLORS["sun"], linewidth=2.2, label=t("summer_days"))
@@ -1079,35 +1492,34 @@ def plot_summer_hot_days(rs_data: dict, shp_name: str):
         ax,
         years,
         t("days"),
-        max(values_mean_sd) * 1.2,
+        values_mean_sd.max() * 1.2,
         title=t("summer_hot_title")
     )
     style_legend(ax)
 
     # Save Plot
     plotname = shp_name + "_" + "sommer_heisse_tage.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[23]:
 
 
-def plot_precipitaion(rs_data: dict, shp_name: str):
+def plot_precipitaion(series: dict, shp_name: str):
     # Precipitation
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Precipitation
-    title, years, values_max, values_mean_pp, values_min = years_values(rs_data, "precipitation")
+    years, values_mean_pp = series["precipitation"]
 
     # Precipitation
-    title, yearsdi, values_max, values_mean_di, values_min = years_values(rs_data, "drought_index")
-    values_mean_di = [di*10 for di in values_mean_di]
+    yearsdi, values_mean_di = series["drought_index"]
+    values_mean_di = values_mean_di * 10
 
     # Plot
     ax.plot(years, values_mean_pp, color=PLOT_COLORS["ice"], linewidth=2.2, label=t("precip_mm"))
@@ -1119,84 +1531,93 @@ def plot_precipitaion(rs_data: dict, shp_name: str):
         ax,
         years,
         t("precip_y"),
-        max(values_mean_pp) * 1.2,
+        values_mean_pp.max() * 1.2,
         title=t("precip_title")
     )
     style_legend(ax)
 
     # Save Plot
     plotname = shp_name + "_" + "niederschlag_trockenheit.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[24]:
 
 
-def plot_precipitaion_days(rs_data: dict, shp_name: str):
+def plot_precipitaion_days(series: dict, shp_name: str):
     # Precipitation Days
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # 10mm
-    title, years, values_max, p10, values_min = years_values(rs_data, "precipGE10mm_days")
+    years, p10 = series["precipGE10mm_days"]
 
     # 20mm
-    title, years, values_max, p20, values_min = years_values(rs_data, "precipGE20mm_days")
-    #p1020 = [p10[i]+p20[i] for i in range(len(p10))]
+    years, p20 = series["precipGE20mm_days"]
 
     # 30mm
-    title, years, values_max, p30, values_min = years_values(rs_data, "precipGE30mm_days")
-    #p102030 = [p10[i]+p20[i]+p30[i] for i in range(len(p10))]
+    years, p30 = series["precipGE30mm_days"]
 
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    # Lower limit (0 days) for every year
+    days_in_year_min = np.zeros(len(years))
 
     # Plot
-    ax.plot(years, p10, color=PLOT_COLORS["ice"], linewidth=2.2, label=t("precip_days_10"))
-    ax.plot(years, p20, color=PLOT_COLORS["deep"], linewidth=2.2, label=t("precip_days_20"))
-    ax.plot(years, p30, color=PLOT_COLORS["violet"], linewidth=2.2, label=t("precip_days_30"))
+    handles = plot_lines(
+        ax,
+        years,
+        [p10, p20, p30],
+        [PLOT_COLORS["ice"], PLOT_COLORS["deep"], PLOT_COLORS["violet"]],
+        [t("precip_days_10"), t("precip_days_20"), t("precip_days_30")],
+    )
 
-    # Fill between lines
-    ax.fill_between(years, p10, p20, color=PLOT_COLORS["ice"], alpha=0.18)
-    ax.fill_between(years, p20, p30, color=PLOT_COLORS["deep"], alpha=0.16)
-    ax.fill_between(years, p30, days_in_year_min, color=PLOT_COLORS["violet"], alpha=0.14)
+    # Fill between lines (the three stacked bands as one collection)
+    from matplotlib.collections import PolyCollection
+    from matplotlib.colors import to_rgba
+
+    years_closed = np.concatenate([years, years[::-1]])
+    bands = [(p10, p20), (p20, p30), (p30, days_in_year_min)]
+    verts = [np.column_stack([years_closed, np.concatenate([upper, lower[::-1]])]) for upper, lower in bands]
+    facecolors = [
+        to_rgba(PLOT_COLORS["ice"], 0.18),
+        to_rgba(PLOT_COLORS["deep"], 0.16),
+        to_rgba(PLOT_COLORS["violet"], 0.14),
+    ]
+    ax.add_collection(PolyCollection(verts, facecolors=facecolors, edgecolors="none"))
 
     apply_plot_style(
         fig,
         ax,
         years,
         t("days"),
-        max(p10) * 1.2,
+        p10.max() * 1.2,
         title=t("heavy_precip_title")
     )
-    style_legend(ax)
+    style_legend(ax, handles)
 
     # Save Plot
     plotname = shp_name + "_" + "starkniederschlag_tage.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[25]:
 
 
-def plot_sunshine_duration(rs_data: dict, shp_name: str):
+def plot_sunshine_duration(series: dict, shp_name: str):
     # Sunshine Duration
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Sunshine Duration
-    title, years, values_max, values_mean_sd, values_min = years_values(rs_data, "sunshine_duration")
-    values_mean_sd = [sd/365 for sd in values_mean_sd]
+    years, values_mean_sd = series["sunshine_duration"]
+    values_mean_sd = values_mean_sd / 365
 
     # Plot
     ax.plot(years, values_mean_sd, color=PLOT_COLORS["sun"], linewidth=2.2, label=t("sunshine_label"))
@@ -1207,40 +1628,33 @@ def plot_sunshine_duration(rs_data: dict, shp_name: str):
         ax,
         years,
         t("sunshine_y"),
-        max(values_mean_sd) * 1.2,
+        values_mean_sd.max() * 1.2,
         title=t("sunshine_title")
     )
     style_legend(ax)
 
     # Save Plot
     plotname = shp_name + "_" + "sonnenscheindauer.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[26]:
 
 
-def plot_vegetation_begin_end(rs_data: dict, shp_name: str):
+def plot_vegetation_begin_end(series: dict, shp_name: str):
     # Vegetation begin and vegetation end
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Vegetation begin line
-    title, years, values_max, values_mean_b, values_min = years_values(rs_data, "vegetation_begin")
+    years, values_mean_b = series["vegetation_begin"]
 
     # Vegetation end line
-    title, years, values_max, values_mean_e, values_min = years_values(rs_data, "vegetation_end")
-
-    # List containing 365 (days per year) as many times as there are years (upper limit)
-    days_in_year_max = [365]*len(years)
-
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    years, values_mean_e = series["vegetation_end"]
 
     # Plot
     ax.plot(years, values_mean_e, color=PLOT_COLORS["coral"], linewidth=2.2, label=t("veg_end"))
@@ -1260,50 +1674,40 @@ def plot_vegetation_begin_end(rs_data: dict, shp_name: str):
 
     # Add month ticks on right side
     ax2 = ax.twinx()
-    month_days = [0, 31, 59, 90, 120, 151, 181, 212, 243, 273, 304, 334]
-    month_labels = ["Jan", "Feb", "Mar", "Apr", "May", "Jun",
-                    "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"] if LANG == "en" else [
-                        "Jan", "Feb", "Mär", "Apr", "Mai", "Jun",
-                        "Jul", "Aug", "Sep", "Okt", "Nov", "Dez"
-                    ]
     ax2.set_ylim(ax.get_ylim())
-    ax2.set_yticks(month_days)
-    ax2.set_yticklabels(month_labels)
+    ax2.set_yticks(_MONTH_DAYS)
+    ax2.set_yticklabels(_MONTH_LABELS.get(LANG, _MONTH_LABELS["de"]))
     ax2.set_ylabel(t("month_start"), color=PLOT_COLORS["slate"])
     ax2.tick_params(axis='y', colors=PLOT_COLORS["slate"])
 
     # Save Plot
     plotname = shp_name + "_" + "vegetationsperiode.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
 
 
 # In[27]:
 
 
-def plot_vegetation_phase_length(rs_data: dict, shp_name: str):
+def plot_vegetation_phase_length(series: dict, shp_name: str):
     # Vegetation phase length
-    plt.close()
 
     # Create a figure containing a single Axes.
-    fig, ax = plt.subplots()
+    fig, ax = _subplots()
 
     # Vegetation begin line
-    title, years, values_max, values_mean_b, values_min = years_values(rs_data, "vegetation_begin")
+    years, values_mean_b = series["vegetation_begin"]
 
     # Vegetation end line
-    title, years, values_max, values_mean_e, values_min = years_values(rs_data, "vegetation_end")
+    years, values_mean_e = series["vegetation_end"]
 
     # Vegetation phase length
-    veg_len = [values_mean_e[i]-values_mean_b[i] for i in range(len(years))]
+    veg_len = values_mean_e - values_mean_b
 
-    # List containing 365 (days per year) as many times as there are years (upper limit)
-    days_in_year_max = [365]*len(years)
-
-    # List containing 365 (days per year) as many times as there are years (lower limit)
-    days_in_year_min = [0]*len(years)
+    # Lower limit (0 days) for every year
+    days_in_year_min = np.zeros(len(years))
 
     # Plot
     ax.plot(years, veg_len, color=PLOT_COLORS["leaf"], linewidth=2.2, label=t("veg_phase"))
@@ -1316,15 +1720,51 @@ def plot_vegetation_phase_length(rs_data: dict, shp_name: str):
 
     # Save Plot
     plotname = shp_name + "_" + "vegetationsperiode_dauer.png"
-    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
     plot_path = str(OUTPUT_DIR / plotname)
     save_plot(fig, plot_path)
     print(f'Successfully created and saved plot: {plotname}')
+    return plot_path
+
+
+# In[28]:
+
+
+_PLOT_SERIES = {}
+
+
+def _init_plot_worker(series: dict, lang: str) -> None:
+    """
+    Initializer of the plot processes, receives the series once per process instead of once per plot,
+    and the language of the run (it may differ from ZCA_LANG when run() is called with lang).
+    """
+    global _PLOT_SERIES, LANG
+    _PLOT_SERIES = series
+    LANG = lang
+
+
+def _plot_from_series(plot, shp_name: str) -> str:
+    """
+    Runs plot with the series of the worker process. Returns the path of the saved plot.
+    """
+    return plot(_PLOT_SERIES, shp_name)
+
+
+def _plot_mp_context():
+    """
+    Start method of the plot processes. Where available the processes are forked from a forkserver
+    that has imported matplotlib and loaded the font cache once, so the workers do not repeat it.
+    Otherwise (Windows) the platform default is used.
+    """
+    if "forkserver" not in multiprocessing.get_all_start_methods():
+        return None
+    ctx = multiprocessing.get_context("forkserver")
+    ctx.set_forkserver_preload(["__main__", "matplotlib.figure", "matplotlib.font_manager"])
+    return ctx
 
 
 # # Run the Program
 
-# In[28]:
+# In[29]:
 
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
@@ -1338,20 +1778,42 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
-def main(argv: list[str] | None = None) -> int:
-    logging.basicConfig(level=logging.INFO, format="%(message)s")
-    args = _parse_args(argv)
+def preload() -> None:
+    """
+    Imports the heavy dependencies (GDAL, PROJ, GeoPandas, matplotlib) that are otherwise imported lazily.
+    Initializer of long-lived worker processes, so the first run() does not pay for the imports.
+    """
+    import geopandas  # noqa: F401
+    import rasterio  # noqa: F401
+    import matplotlib.figure  # noqa: F401
 
-    if args.shapefile:
-        shp = Path(args.shapefile).expanduser().resolve()
-        if not shp.exists():
-            raise FileNotFoundError(f"Shapefile not found: {shp}")
-    else:
-        shp = get_shp()
+
+def run(
+    shapefile: str | Path,
+    lang: str | None = None,
+    skip_download: bool = False,
+    raster_ready: bool | None = None,
+) -> list[str]:
+    """
+    Runs the whole analysis (download, zonal stats, map and plots) for shapefile.
+    Used by main() and, in a long-lived worker process, by the web API.
+    Args:
+        shapefile (str | Path): path to the shapefile (or GeoPackage) to analyze
+        lang (str): language of the plots ("de" or "en"), ZCA_LANG if not given
+        skip_download (bool): use the local rasters only (also set by ZCA_SKIP_DWD_DOWNLOAD)
+        raster_ready (bool): whether the local rasters are present, if already known (checked otherwise)
+    Returns:
+        outputs (list[str]): paths of the created map and plots
+    """
+    global LANG
+    if lang:
+        LANG = "en" if lang.lower().startswith("en") else "de"
+
+    shp = Path(shapefile)
 
     print("\nDownload the data:")
     raster_root = DATA_DIR
-    skip_download = args.skip_download or os.environ.get("ZCA_SKIP_DWD_DOWNLOAD", "").lower() in {
+    skip_download = skip_download or os.environ.get("ZCA_SKIP_DWD_DOWNLOAD", "").lower() in {
         "1",
         "true",
         "yes",
@@ -1359,7 +1821,9 @@ def main(argv: list[str] | None = None) -> int:
 
     session = _build_session()
     if skip_download:
-        if not local_raster_ready(raster_root):
+        if raster_ready is None:
+            raster_ready = local_raster_ready(raster_root)
+        if not raster_ready:
             raise RuntimeError(
                 "Raster data not found locally. "
                 "Unset ZCA_SKIP_DWD_DOWNLOAD to allow downloads."
@@ -1371,33 +1835,76 @@ def main(argv: list[str] | None = None) -> int:
 
         if check_if_already_downloaded(raster_links, raster_root):
             print("All files are already downloaded.")
+            # Rasters downloaded before the manifest existed: write it, so the next start can use it
+            if not (raster_root / MANIFEST_NAME).exists():
+                write_download_manifest(raster_links, raster_root)
         else:
             print("Download the PDF files containing information about the DWD data:")
             download_dwd_data(session, pdf_links, DATA_INFO_DIR)
 
             print("Download the raster files:")
             download_dwd_data(session, raster_links, DATA_DIR)
+            write_download_manifest(raster_links, DATA_DIR)
 
     print("\nProcess the data:")
     rasterstats_json, shp_crs_dissolved = zonal_climate_analysis(shp, str(DATA_DIR), str(PRJ_FILE))
 
     input_file = rasterstats_json
-    with open(input_file, "r", encoding="utf-8") as json_file:
-        rs = json.load(json_file)
+    if orjson is not None:
+        rs = orjson.loads(Path(input_file).read_bytes())
+    else:
+        with open(input_file, "r", encoding="utf-8") as json_file:
+            rs = json.load(json_file)
 
     print("\nCreating Map and Plots:")
     shp_name = shp.stem
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+
+    # Extract the yearly mean of every plotted parameter once as arrays (the plots only show the mean),
+    # the nested dict is not needed afterwards
+    series = {key: years_values(rs, key) for key in PLOT_KEYS}
+    del rs
+
+    plots = [
+        plot_air_temp_min_mean_max,
+        plot_frost_ice_days,
+        plot_snowcover_days,
+        plot_summer_hot_days,
+        plot_precipitaion,
+        plot_precipitaion_days,
+        plot_sunshine_duration,
+        plot_vegetation_begin_end,
+        plot_vegetation_phase_length,
+    ]
+
+    # The plots are independent: render them in parallel processes (the series and the language are
+    # sent once per process with the initializer) and create the map in the meantime.
+    with ProcessPoolExecutor(max_workers=min(len(plots), os.cpu_count() or 1),
+                             mp_context=_plot_mp_context(),
+                             initializer=_init_plot_worker,
+                             initargs=(series, LANG)) as ex:
+        futures = [ex.submit(_plot_from_series, plot, shp_name) for plot in plots]
+
+        map_path = create_map(shp_crs_dissolved, shp_name)
+
+        # Re-raise errors of the plot processes
+        plot_paths = [future.result() for future in futures]
+
+    return [map_path, *plot_paths]
+
+
+def main(argv: list[str] | None = None) -> int:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    args = _parse_args(argv)
+
+    if args.shapefile:
+        shp = Path(args.shapefile).expanduser().resolve()
+        if not shp.exists():
+            raise FileNotFoundError(f"Shapefile not found: {shp}")
+    else:
+        shp = get_shp()
 
-    create_map(shp_crs_dissolved, shp_name)
-    plot_air_temp_min_mean_max(rs, shp_name)
-    plot_frost_ice_days(rs, shp_name)
-    plot_snowcover_days(rs, shp_name)
-    plot_summer_hot_days(rs, shp_name)
-    plot_precipitaion(rs, shp_name)
-    plot_precipitaion_days(rs, shp_name)
-    plot_sunshine_duration(rs, shp_name)
-    plot_vegetation_begin_end(rs, shp_name)
-    plot_vegetation_phase_length(rs, shp_name)
+    run(shp, skip_download=args.skip_download)
 
     print("\nFinished!")
     print(f"\nMap and plots are saved here:\n{OUTPUT_DIR}\n")
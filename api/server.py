@@ -1,27 +1,37 @@
 from __future__ import annotations
 
+import fcntl
 import json
 import logging
+import multiprocessing
 import os
 import shutil
+import signal
 import subprocess
 import sys
 import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from concurrent.futures.process import BrokenProcessPool
 from contextlib import contextmanager
 from pathlib import Path
 from uuid import uuid4
 
-from fastapi import FastAPI, File, HTTPException, UploadFile, Form
+from fastapi import BackgroundTasks, FastAPI, File, HTTPException, UploadFile, Form
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from pydantic import BaseModel
 import geopandas as gpd
 import rasterio
+import shapely
 from shapely.geometry import box, mapping, shape
-from shapely.ops import unary_union
-import fiona
+import pyogrio
+
+try:
+    import pyarrow  # noqa: F401  (GeoParquet support of geopandas)
+except ImportError:  # Optional, the boundary is read from the shapefile as fallback.
+    pyarrow = None
 
 LOGGER = logging.getLogger("zca.api")
 
@@ -31,10 +41,19 @@ RUNS_DIR = OUTPUT_DIR / "web_runs"
 RASTER_DIR = BASE_DIR / "climate_environment_CDC_grids_germany_annual"
 GERMANY_BOUNDARY_PATH = BASE_DIR / "germany_boundary" / "german_boundary.shp"
 
+# The analyzer lives next to the api package
+if str(BASE_DIR) not in sys.path:
+    sys.path.insert(0, str(BASE_DIR))
+import ZonalClimateAnalyzer  # noqa: E402
+
 ALLOWED_EXT = {".zip", ".shp", ".gpkg", ".geojson"}
 ALLOWED_ARCHIVE_EXT = {".shp", ".shx", ".dbf", ".prj", ".cpg"}
+POLYGON_TYPES = ("Polygon", "MultiPolygon")
+# Same vector I/O engine as the analyzer
+GEO_IO_ENGINE = ZonalClimateAnalyzer.GEO_IO_ENGINE
 MAX_UPLOAD_MB = int(os.environ.get("ZCA_MAX_UPLOAD_MB", "200"))
 MAX_UPLOAD_BYTES = MAX_UPLOAD_MB * 1024 * 1024
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
 MAX_ZIP_FILES = int(os.environ.get("ZCA_MAX_ZIP_FILES", "2000"))
 MAX_ZIP_UNCOMPRESSED_BYTES = int(os.environ.get("ZCA_MAX_ZIP_UNCOMPRESSED_MB", "1600")) * 1024 * 1024
 MAX_FEATURES = int(os.environ.get("ZCA_MAX_FEATURES", "2000"))
@@ -45,11 +64,24 @@ RATE_LIMIT_PER_MIN = int(os.environ.get("ZCA_RATE_LIMIT_PER_MIN", "120"))
 REQUIRE_CLAMSCAN = os.environ.get("ZCA_REQUIRE_CLAMSCAN", "0") == "1"
 
 LOCK_PATH = OUTPUT_DIR / ".analysis.lock"
-LOCK_TTL_SECONDS = int(os.environ.get("ZCA_LOCK_TTL_SECONDS", str(60 * 60 * 4)))
-DATA_COVERAGE_PATH = OUTPUT_DIR / "data_coverage.geojson"
+# v2: older caches hold a boundary that was simplified inwards and are ignored
+DATA_COVERAGE_PATH = OUTPUT_DIR / "data_coverage_v2.geojson"
+COVERAGE_SIMPLIFY_TOLERANCE = 0.001
+BOUNDARY_CACHE_PATH = OUTPUT_DIR / "germany_boundary.parquet"
+RASTER_INDEX_PATH = OUTPUT_DIR / "raster_index.json"
 
 DATA_COVERAGE_GEOJSON = None
 DATA_COVERAGE_GEOM = None
+DATA_COVERAGE_BOUNDS = None
+
+ANALYZER_TIMEOUT_SECONDS = 60 * 60
+_ANALYZER_POOL = None
+_ANALYZER_PID = None
+
+RASTER_SCAN_TTL_SECONDS = 30
+CLEANUP_INTERVAL_SECONDS = 60 * 60
+_LAST_CLEANUP = 0.0
+_RASTER_SCAN_CACHE = {"ts": 0.0, "ready": False, "mtime": 0.0}
 
 app = FastAPI(title="Zonal Climate Analyzer API")
 
@@ -93,17 +125,22 @@ def _client_ip(request) -> str:
     return request.client.host if request.client else "unknown"
 
 
-_RATE_LIMIT = {}
+# Request counts per client IP of the current minute only (reset on rollover, no stale entries)
+_RATE_WINDOW = {"minute": 0, "counts": {}}
 
 
 @app.middleware("http")
 async def rate_limit_middleware(request, call_next):
     if RATE_LIMIT_PER_MIN <= 0:
         return await call_next(request)
-    now = int(time.time())
-    key = (now // 60, _client_ip(request))
-    count = _RATE_LIMIT.get(key, 0) + 1
-    _RATE_LIMIT[key] = count
+    minute = int(time.time()) // 60
+    if minute != _RATE_WINDOW["minute"]:
+        _RATE_WINDOW["minute"] = minute
+        _RATE_WINDOW["counts"] = {}
+    counts = _RATE_WINDOW["counts"]
+    ip = _client_ip(request)
+    count = counts.get(ip, 0) + 1
+    counts[ip] = count
     if count > RATE_LIMIT_PER_MIN:
         raise HTTPException(status_code=429, detail="Too many requests. Please slow down.")
     return await call_next(request)
@@ -119,51 +156,11 @@ async def security_headers_middleware(request, call_next):
     return response
 
 
-def _read_lock() -> dict | None:
-    try:
-        raw = LOCK_PATH.read_text(encoding="utf-8").strip()
-        if not raw:
-            return None
-        data = json.loads(raw)
-        if isinstance(data, dict):
-            return data
-    except Exception:
-        return None
-    return None
-
-
-def _pid_is_alive(pid: int) -> bool:
-    return Path(f"/proc/{pid}").exists()
-
-
-def _cleanup_lock() -> None:
-    if not LOCK_PATH.exists():
-        return
-    data = _read_lock()
-    if not data:
-        try:
-            LOCK_PATH.unlink()
-        except OSError:
-            pass
-        return
-    pid = data.get("pid")
-    ts = data.get("ts")
-    if isinstance(pid, int) and _pid_is_alive(pid):
-        return
-    if isinstance(ts, (int, float)) and time.time() - ts < LOCK_TTL_SECONDS:
-        return
-    try:
-        LOCK_PATH.unlink()
-    except OSError:
-        pass
-
-
-@app.on_event("startup")
-def _cleanup_lock_on_startup() -> None:
-    _cleanup_lock()
-
-
 def _cleanup_old_runs() -> None:
+    global _LAST_CLEANUP
+    # Stamped when the cleanup actually runs: a queued task that is dropped (the request failed)
+    # does not hold back the next one.
+    _LAST_CLEANUP = time.time()
     if RUN_RETENTION_HOURS <= 0 or not RUNS_DIR.exists():
         return
     cutoff = time.time() - RUN_RETENTION_HOURS * 3600
@@ -177,21 +174,85 @@ def _cleanup_old_runs() -> None:
             continue
 
 
+def _schedule_cleanup(background_tasks: BackgroundTasks) -> None:
+    if time.time() - _LAST_CLEANUP < CLEANUP_INTERVAL_SECONDS:
+        return
+    # Runs after the response is sent, at most once per interval, instead of on every request
+    background_tasks.add_task(_cleanup_old_runs)
+
+
 @app.on_event("startup")
 def _cleanup_runs_on_startup() -> None:
     _cleanup_old_runs()
 
 
+def _set_data_coverage(geom, geojson: dict) -> None:
+    global DATA_COVERAGE_GEOJSON, DATA_COVERAGE_GEOM, DATA_COVERAGE_BOUNDS
+    # Prepared once (in place), so every covers() check reuses the GEOS index of the coverage polygon.
+    shapely.prepare(geom)
+    DATA_COVERAGE_GEOM = geom
+    DATA_COVERAGE_BOUNDS = geom.bounds
+    DATA_COVERAGE_GEOJSON = geojson
+
+
+def _load_boundary() -> gpd.GeoDataFrame:
+    """
+    Reads the Germany boundary, from a GeoParquet copy when pyarrow is available
+    (written on the first read, refreshed when the shapefile is newer).
+    """
+    if pyarrow is None:
+        return gpd.read_file(GERMANY_BOUNDARY_PATH, engine=GEO_IO_ENGINE)
+    try:
+        if BOUNDARY_CACHE_PATH.stat().st_mtime >= GERMANY_BOUNDARY_PATH.stat().st_mtime:
+            return gpd.read_parquet(BOUNDARY_CACHE_PATH)
+    except Exception:
+        pass
+    gdf = gpd.read_file(GERMANY_BOUNDARY_PATH, engine=GEO_IO_ENGINE)
+    try:
+        gdf.to_parquet(BOUNDARY_CACHE_PATH, compression="zstd")
+    except Exception:
+        LOGGER.warning("Unable to cache the boundary as GeoParquet.", exc_info=True)
+    return gdf
+
+
+def _scan_raster_bounds(tif_files: list[Path]) -> tuple[list[list[float]], str | None]:
+    """
+    Returns the bounds (left, bottom, right, top) of every tif and their CRS (WKT).
+    The bounds are cached in RASTER_INDEX_PATH, only new or modified tifs are opened.
+    """
+    try:
+        index = json.loads(RASTER_INDEX_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        index = {}
+
+    updated = {}
+    for tif in tif_files:
+        key = str(tif)
+        mtime = tif.stat().st_mtime
+        entry = index.get(key)
+        if not entry or entry.get("mtime") != mtime:
+            with rasterio.open(tif) as src:
+                entry = {"mtime": mtime, "bounds": list(src.bounds), "crs": src.crs.to_wkt() if src.crs else None}
+        updated[key] = entry
+
+    if updated != index:
+        try:
+            RASTER_INDEX_PATH.write_text(json.dumps(updated), encoding="utf-8")
+        except OSError:
+            LOGGER.warning("Unable to write the raster index.", exc_info=True)
+
+    crs = next((entry["crs"] for entry in updated.values() if entry["crs"]), None)
+    return [entry["bounds"] for entry in updated.values()], crs
+
+
 def _load_data_coverage() -> None:
-    global DATA_COVERAGE_GEOJSON, DATA_COVERAGE_GEOM
     if DATA_COVERAGE_GEOJSON is not None:
         return
 
     if DATA_COVERAGE_PATH.exists():
         try:
             stored = json.loads(DATA_COVERAGE_PATH.read_text(encoding="utf-8"))
-            DATA_COVERAGE_GEOJSON = stored
-            DATA_COVERAGE_GEOM = shape(stored)
+            _set_data_coverage(shape(stored), stored)
             return
         except Exception:
             try:
@@ -200,10 +261,15 @@ def _load_data_coverage() -> None:
                 pass
 
     if GERMANY_BOUNDARY_PATH.exists():
-        gdf = gpd.read_file(GERMANY_BOUNDARY_PATH).to_crs("EPSG:4326")
-        geom = gdf.unary_union.buffer(0)
-        DATA_COVERAGE_GEOM = geom
-        DATA_COVERAGE_GEOJSON = mapping(geom)
+        gdf = _load_boundary().to_crs("EPSG:4326")
+        # Simplified (~100 m) so covers() walks far fewer boundary vertices. Simplifying moves the
+        # boundary by at most the tolerance, in both directions, so it is grown outwards by the same
+        # amount (mitre joins, never inside the round buffer): the result still covers the real
+        # boundary, and an area sharing Germany's border is still accepted.
+        geom = gdf.unary_union.simplify(COVERAGE_SIMPLIFY_TOLERANCE, preserve_topology=True).buffer(
+            COVERAGE_SIMPLIFY_TOLERANCE, join_style="mitre"
+        )
+        _set_data_coverage(geom, mapping(geom))
         DATA_COVERAGE_PATH.write_text(json.dumps(DATA_COVERAGE_GEOJSON), encoding="utf-8")
         return
 
@@ -214,36 +280,54 @@ def _load_data_coverage() -> None:
     if not tif_files:
         raise RuntimeError("No .tif files found for coverage.")
 
-    boxes = []
-    crs = None
-    for tif in tif_files:
-        with rasterio.open(tif) as src:
-            crs = src.crs
-            bounds = src.bounds
-            boxes.append(box(bounds.left, bounds.bottom, bounds.right, bounds.top))
+    bounds, crs = _scan_raster_bounds(tif_files)
 
-    coverage = unary_union(boxes).buffer(0)
+    # The DWD rasters share one grid: the box around all of them instead of a union of every raster box.
+    coverage = box(
+        min(b[0] for b in bounds),
+        min(b[1] for b in bounds),
+        max(b[2] for b in bounds),
+        max(b[3] for b in bounds),
+    )
     gdf = gpd.GeoDataFrame(geometry=[coverage], crs=crs)
     gdf = gdf.to_crs("EPSG:4326")
 
     geom = gdf.geometry.iloc[0]
-    DATA_COVERAGE_GEOM = geom
-    DATA_COVERAGE_GEOJSON = mapping(geom)
+    _set_data_coverage(geom, mapping(geom))
     DATA_COVERAGE_PATH.write_text(json.dumps(DATA_COVERAGE_GEOJSON), encoding="utf-8")
 
 
+@app.on_event("startup")
+def _preload_coverage_on_startup() -> None:
+    # Load the coverage before the first request instead of on its hot path.
+    try:
+        _load_data_coverage()
+    except Exception:
+        LOGGER.exception("Unable to preload the data coverage, it is loaded on the first request.")
+
+
 def _ensure_within_coverage(gdf: gpd.GeoDataFrame) -> None:
     _load_data_coverage()
     if gdf.crs is None:
         raise HTTPException(status_code=400, detail="CRS is missing. Please include a .prj file.")
-    gdf = gdf.to_crs("EPSG:4326")
+    # Drawn polygons already arrive in WGS84, skip the reprojection copy for them
+    if gdf.crs.to_epsg() != 4326:
+        gdf = gdf.to_crs("EPSG:4326")
     gdf = gdf[gdf.geometry.notnull()]
     if gdf.empty:
         raise HTTPException(status_code=400, detail="No valid geometries found.")
-    if not gdf.geom_type.str.contains("polygon", case=False, na=False).any():
+    if not gdf.geom_type.isin(POLYGON_TYPES).any():
         raise HTTPException(status_code=400, detail="Only polygon geometries are supported.")
-    outside = ~gdf.geometry.apply(lambda geom: DATA_COVERAGE_GEOM.covers(geom))
-    if outside.any():
+    geoms = gdf.geometry.to_numpy()
+    # A covered feature must have its bbox inside the coverage bbox: reject on bounds alone first
+    bounds = shapely.bounds(geoms)
+    cov_minx, cov_miny, cov_maxx, cov_maxy = DATA_COVERAGE_BOUNDS
+    outside_bbox = (
+        (bounds[:, 0] < cov_minx) | (bounds[:, 1] < cov_miny)
+        | (bounds[:, 2] > cov_maxx) | (bounds[:, 3] > cov_maxy)
+    )
+    # One vectorized GEOS call for all features
+    if outside_bbox.any() or not shapely.covers(DATA_COVERAGE_GEOM, geoms).all():
         raise HTTPException(
             status_code=400,
             detail="All polygons must lie within the raster coverage area."
@@ -252,31 +336,23 @@ def _ensure_within_coverage(gdf: gpd.GeoDataFrame) -> None:
 
 @contextmanager
 def _analysis_lock():
-    now = time.time()
-    if LOCK_PATH.exists():
-        _cleanup_lock()
-    if LOCK_PATH.exists():
-        data = _read_lock()
-        ts = data.get("ts") if data else None
-        if isinstance(ts, (int, float)) and now - ts < LOCK_TTL_SECONDS:
-            raise HTTPException(status_code=429, detail="Analyzer is busy. Try again soon.")
-        try:
-            LOCK_PATH.unlink()
-        except OSError:
-            pass
-
+    # Kernel lock on a fresh open file description: contended by other requests and
+    # processes alike, and released by the kernel if the holder dies.
     try:
-        LOCK_PATH.write_text(json.dumps({"pid": os.getpid(), "ts": now}), encoding="utf-8")
+        fd = os.open(LOCK_PATH, os.O_CREAT | os.O_RDWR, 0o644)
     except OSError as exc:
         raise HTTPException(status_code=500, detail="Unable to acquire analysis lock.") from exc
-
     try:
-        yield
-    finally:
         try:
-            LOCK_PATH.unlink()
-        except OSError:
-            pass
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError as exc:
+            raise HTTPException(status_code=429, detail="Analyzer is busy. Try again soon.") from exc
+        try:
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
 
 
 def _safe_extract_zip(zip_ref: zipfile.ZipFile, dest_dir: Path) -> None:
@@ -286,9 +362,16 @@ def _safe_extract_zip(zip_ref: zipfile.ZipFile, dest_dir: Path) -> None:
     total_uncompressed = sum(member.file_size for member in members)
     if total_uncompressed > MAX_ZIP_UNCOMPRESSED_BYTES:
         raise HTTPException(status_code=400, detail="Zip file is too large to extract.")
+    # Resolve the destination once, the members are checked on normalized paths (no filesystem access)
+    dest_root = str(dest_dir.resolve())
     for member in members:
-        target = dest_dir / member.filename
-        if not str(target.resolve()).startswith(str(dest_dir.resolve())):
+        name = member.filename
+        target = os.path.normpath(os.path.join(dest_root, name))
+        if (
+            os.path.isabs(name)
+            or ".." in Path(name).parts
+            or not (target == dest_root or target.startswith(dest_root + os.sep))
+        ):
             raise HTTPException(status_code=400, detail="Invalid zip contents.")
         if member.is_dir():
             continue
@@ -308,8 +391,19 @@ def _run_clamscan(path: Path) -> None:
             )
         LOGGER.warning("clamscan not found; skipping malware scan.")
         return
+    # Zip members are only scanned through clamscan's archive support: raise its size limits to the
+    # upload limits (its defaults silently skip large members) and flag anything still over them.
+    limit_mb = max(MAX_UPLOAD_BYTES, MAX_ZIP_UNCOMPRESSED_BYTES) // (1024 * 1024)
     result = subprocess.run(
-        [clamscan, "--no-summary", "-r", str(path)],
+        [
+            clamscan,
+            "--no-summary",
+            "-r",
+            f"--max-filesize={limit_mb}M",
+            f"--max-scansize={limit_mb}M",
+            "--alert-exceeds-max=yes",
+            str(path),
+        ],
         text=True,
         capture_output=True,
         timeout=900
@@ -333,22 +427,32 @@ def _cleanup_run_dir(run_dir: Path) -> None:
         shutil.rmtree(run_dir, ignore_errors=True)
 
 
+class _CountingReader:
+    """
+    Wraps the upload file, counts the bytes read and stops once more than MAX_UPLOAD_BYTES were read.
+    """
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.size = 0
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.raw.read(size)
+        self.size += len(chunk)
+        if self.size > MAX_UPLOAD_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail=f"Upload too large. Max {MAX_UPLOAD_MB}MB.",
+            )
+        return chunk
+
+
 def _write_upload(upload_file: UploadFile, destination: Path) -> int:
-    size = 0
+    reader = _CountingReader(upload_file.file)
     with destination.open("wb") as buffer:
-        while True:
-            # Stream to disk to avoid buffering large uploads in memory.
-            chunk = upload_file.file.read(1024 * 1024)
-            if not chunk:
-                break
-            size += len(chunk)
-            if size > MAX_UPLOAD_BYTES:
-                raise HTTPException(
-                    status_code=413,
-                    detail=f"Upload too large. Max {MAX_UPLOAD_MB}MB.",
-                )
-            buffer.write(chunk)
-    return size
+        # Stream to disk in large chunks to avoid buffering large uploads in memory.
+        shutil.copyfileobj(reader, buffer, UPLOAD_CHUNK_SIZE)
+    return reader.size
 
 
 def _ensure_disk_space() -> None:
@@ -358,21 +462,12 @@ def _ensure_disk_space() -> None:
         raise HTTPException(status_code=507, detail="Server disk space is too low.")
 
 
-def _count_vertices(geom) -> int:
-    if geom is None:
-        return 0
-    if geom.geom_type == "Polygon":
-        rings = [geom.exterior] + list(geom.interiors)
-        return sum(len(ring.coords) for ring in rings if ring is not None)
-    if geom.geom_type == "MultiPolygon":
-        return sum(_count_vertices(g) for g in geom.geoms)
-    return 0
-
-
 def _validate_geo_limits(gdf: gpd.GeoDataFrame) -> None:
     if len(gdf) > MAX_FEATURES:
         raise HTTPException(status_code=400, detail="Too many features in upload.")
-    vertex_count = int(gdf.geometry.apply(_count_vertices).sum())
+    # Vertices of all polygon rings in one vectorized call (other geometry types are not counted)
+    polygons = gdf.geometry[gdf.geom_type.isin(POLYGON_TYPES)]
+    vertex_count = len(shapely.get_coordinates(polygons.to_numpy()))
     if vertex_count > MAX_VERTICES:
         raise HTTPException(status_code=400, detail="Geometry is too complex.")
 
@@ -392,26 +487,29 @@ def _validate_shapefile(shp_path: Path) -> None:
 
 def _load_geodataframe(path: Path, layer: str | None = None) -> gpd.GeoDataFrame:
     try:
-        return gpd.read_file(path, layer=layer)
+        return gpd.read_file(path, layer=layer, engine=GEO_IO_ENGINE)
     except Exception as exc:
         raise HTTPException(status_code=400, detail="Unable to read the vector file.") from exc
 
 
 def _load_geopackage(path: Path) -> gpd.GeoDataFrame:
     try:
-        layers = fiona.listlayers(path)
+        layers = pyogrio.list_layers(path)
     except Exception as exc:
         raise HTTPException(status_code=400, detail="Invalid GeoPackage file.") from exc
-    if not layers:
+    if not len(layers):
         raise HTTPException(status_code=400, detail="GeoPackage has no layers.")
-    for layer in layers:
+    for layer, geometry_type in layers:
+        # Attribute-only tables have no geometry type, they can not contain usable features
+        if geometry_type is None:
+            continue
         gdf = _load_geodataframe(path, layer=layer)
         if not gdf.empty:
             return gdf
     raise HTTPException(status_code=400, detail="GeoPackage has no usable features.")
 
 
-def _collect_outputs(shp_stem: str, run_dir: Path) -> list[dict]:
+def _collect_outputs(shp_stem: str, run_dir: Path, files: list[str]) -> list[dict]:
     results_dir = run_dir / "results"
     results_dir.mkdir(parents=True, exist_ok=True)
 
@@ -429,16 +527,18 @@ def _collect_outputs(shp_stem: str, run_dir: Path) -> list[dict]:
     }
 
     outputs = []
-    for file in OUTPUT_DIR.iterdir():
-        if not file.is_file():
-            continue
-        if not file.name.startswith(f"{shp_stem}_"):
-            continue
+    # The files the analyzer reports having written, instead of a scan of OUTPUT_DIR
+    for file in map(Path, files):
         if file.suffix.lower() not in {".png", ".html"}:
             continue
 
+        # Hard link instead of a copy (same filesystem). The analyzer replaces its outputs with new
+        # files (.part + rename), never rewrites them in place, so the run keeps its version.
         dest = results_dir / file.name
-        shutil.copy2(file, dest)
+        try:
+            os.link(file, dest)
+        except OSError:
+            shutil.copy2(file, dest)
 
         output_type = "map" if file.suffix.lower() == ".html" else "plot"
         stem = file.stem
@@ -466,56 +566,113 @@ def _build_run_zip(run_dir: Path) -> Path:
     if not results_dir.exists():
         raise HTTPException(status_code=404, detail="Run results not found.")
     zip_path = run_dir / "outputs.zip"
-    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+    with zipfile.ZipFile(zip_path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         for file in sorted(results_dir.iterdir()):
             if not file.is_file():
                 continue
-            zf.write(file, arcname=file.name)
+            # PNGs are deflate-compressed already, store them as they are.
+            if file.suffix.lower() == ".png":
+                zf.write(file, arcname=file.name, compress_type=zipfile.ZIP_STORED)
+            else:
+                zf.write(file, arcname=file.name)
     return zip_path
 
 
-def _purge_outputs_for_stem(stem: str) -> None:
-    for file in OUTPUT_DIR.iterdir():
-        if file.is_file() and file.name.startswith(f"{stem}_"):
-            try:
-                file.unlink()
-            except OSError:
-                pass
+def _has_raster_file(path: Path) -> bool:
+    # Single walk over the tree, stopping at the first raster found
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                if _has_raster_file(Path(entry.path)):
+                    return True
+            elif entry.name.endswith((".tif", ".asc", ".asc.gz")):
+                return True
+    return False
 
 
 def _local_raster_ready() -> bool:
-    if not RASTER_DIR.exists():
-        return False
-    if not any(RASTER_DIR.iterdir()):
+    try:
+        mtime = RASTER_DIR.stat().st_mtime
+    except FileNotFoundError:
         return False
-    for ext in (".tif", ".asc", ".asc.gz"):
-        if any(RASTER_DIR.rglob(f"*{ext}")):
-            return True
-    return False
+    now = time.time()
+    cache = _RASTER_SCAN_CACHE
+    if now - cache["ts"] < RASTER_SCAN_TTL_SECONDS and cache["mtime"] == mtime:
+        return cache["ready"]
+    cache["ready"] = _has_raster_file(RASTER_DIR)
+    cache["mtime"] = mtime
+    cache["ts"] = now
+    return cache["ready"]
+
+
+def _analyzer_pool() -> ProcessPoolExecutor:
+    global _ANALYZER_POOL, _ANALYZER_PID
+    if _ANALYZER_POOL is None:
+        # One long-lived worker process that has imported GDAL/GeoPandas once, instead of a new
+        # interpreter per request. Spawned, so it does not inherit the threads of the server.
+        _ANALYZER_POOL = ProcessPoolExecutor(
+            max_workers=1,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=ZonalClimateAnalyzer.preload,
+        )
+        # First task of the worker: its PID, to stop it after a timeout. Submitting it also
+        # starts the worker (and its imports) right away.
+        _ANALYZER_PID = _ANALYZER_POOL.submit(os.getpid)
+    return _ANALYZER_POOL
+
+
+def _reset_analyzer_pool(terminate: bool = False) -> None:
+    global _ANALYZER_POOL, _ANALYZER_PID
+    pool, _ANALYZER_POOL = _ANALYZER_POOL, None
+    pid, _ANALYZER_PID = _ANALYZER_PID, None
+    if pool is None:
+        return
+    if terminate and pid is not None and pid.done() and pid.exception() is None:
+        # The executor has no public way to stop a running task (e.g. after a timeout).
+        try:
+            os.kill(pid.result(), signal.SIGTERM)
+        except OSError:
+            pass
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+@app.on_event("startup")
+def _start_analyzer_on_startup() -> None:
+    # Start the worker (and its imports) before the first request.
+    _analyzer_pool()
+
+
+@app.on_event("shutdown")
+def _stop_analyzer_on_shutdown() -> None:
+    _reset_analyzer_pool()
 
 
 def _run_analyzer(shp_path: Path, run_dir: Path, lang: str | None = None) -> list[dict]:
-    _purge_outputs_for_stem(shp_path.stem)
     with _analysis_lock():
-        env = os.environ.copy()
-        env["ZCA_LANG"] = _normalize_lang(lang)
-        if _local_raster_ready():
-            env.setdefault("ZCA_SKIP_DWD_DOWNLOAD", "1")
-        process = subprocess.run(
-            [sys.executable, str(BASE_DIR / "ZonalClimateAnalyzer.py"), str(shp_path)],
-            text=True,
-            cwd=str(BASE_DIR),
-            capture_output=True,
-            env=env,
-            timeout=60 * 60
-        )
-
-    if process.returncode != 0:
-        error_snippet = (process.stderr or process.stdout or "").strip()
-        error_snippet = error_snippet[-1200:]
-        raise HTTPException(status_code=500, detail=f"Analyzer failed. {error_snippet}")
+        raster_ready = _local_raster_ready()
+        try:
+            # The readiness is passed on, so the worker does not walk the raster tree again.
+            future = _analyzer_pool().submit(
+                ZonalClimateAnalyzer.run,
+                str(shp_path),
+                _normalize_lang(lang),
+                skip_download=raster_ready,
+                raster_ready=raster_ready,
+            )
+            files = future.result(timeout=ANALYZER_TIMEOUT_SECONDS)
+        except FutureTimeoutError as exc:
+            _reset_analyzer_pool(terminate=True)
+            raise HTTPException(status_code=500, detail="Analyzer failed. Timed out.") from exc
+        except BrokenProcessPool as exc:
+            # The worker died (e.g. killed for memory), a new one is started with the next request.
+            _reset_analyzer_pool()
+            raise HTTPException(status_code=500, detail="Analyzer failed. The worker process exited.") from exc
+        except Exception as exc:
+            LOGGER.exception("Analyzer failed.")
+            error_snippet = f"{type(exc).__name__}: {exc}"[-1200:]
+            raise HTTPException(status_code=500, detail=f"Analyzer failed. {error_snippet}") from exc
 
-    return _collect_outputs(shp_path.stem, run_dir)
+    return _collect_outputs(shp_path.stem, run_dir, files)
 
 
 @app.get("/api/coverage")
@@ -527,9 +684,9 @@ def data_coverage():
 
 
 @app.post("/api/analyze")
-async def analyze(file: UploadFile = File(...), lang: str = Form("de")):
+async def analyze(background_tasks: BackgroundTasks, file: UploadFile = File(...), lang: str = Form("de")):
     _ensure_disk_space()
-    _cleanup_old_runs()
+    _schedule_cleanup(background_tasks)
     filename = file.filename or ""
     ext = Path(filename).suffix.lower()
 
@@ -544,6 +701,7 @@ async def analyze(file: UploadFile = File(...), lang: str = Form("de")):
     upload_path = upload_dir / filename
     try:
         _write_upload(file, upload_path)
+        # clamscan inspects zip members itself, the extracted files are not scanned a second time
         _run_clamscan(upload_path)
 
         if ext == ".zip":
@@ -552,7 +710,6 @@ async def analyze(file: UploadFile = File(...), lang: str = Form("de")):
                     _safe_extract_zip(zip_ref, upload_dir)
             except zipfile.BadZipFile as exc:
                 raise HTTPException(status_code=400, detail="Invalid zip file.") from exc
-            _run_clamscan(upload_dir)
 
         if ext in {".gpkg", ".geojson"}:
             if ext == ".gpkg":
@@ -563,8 +720,9 @@ async def analyze(file: UploadFile = File(...), lang: str = Form("de")):
             if gdf.crs is None:
                 gdf = gdf.set_crs("EPSG:4326", allow_override=True)
             _ensure_within_coverage(gdf)
-            shp_path = upload_dir / "uploaded_vector.shp"
-            gdf.to_file(shp_path, driver="ESRI Shapefile", index=False)
+            # GeoPackage instead of a shapefile: one file, no separate .shx/.dbf/.prj writes.
+            shp_path = upload_dir / "uploaded_vector.gpkg"
+            gdf.to_file(shp_path, driver="GPKG", index=False, engine=GEO_IO_ENGINE)
         else:
             shp_path = _find_shapefile(upload_dir)
             _validate_shapefile(shp_path)
@@ -589,9 +747,9 @@ async def analyze(file: UploadFile = File(...), lang: str = Form("de")):
 
 
 @app.post("/api/analyze-geojson")
-async def analyze_geojson(payload: GeoJSONPayload):
+async def analyze_geojson(payload: GeoJSONPayload, background_tasks: BackgroundTasks):
     _ensure_disk_space()
-    _cleanup_old_runs()
+    _schedule_cleanup(background_tasks)
     run_id = uuid4().hex
     run_dir = RUNS_DIR / run_id
     upload_dir = run_dir / "upload"
@@ -603,13 +761,13 @@ async def analyze_geojson(payload: GeoJSONPayload):
         _run_clamscan(geojson_path)
 
         try:
-            gdf = gpd.read_file(geojson_path)
+            gdf = gpd.read_file(geojson_path, engine=GEO_IO_ENGINE)
         except Exception as exc:
             raise HTTPException(status_code=400, detail="Invalid GeoJSON.") from exc
 
         if gdf.empty:
             raise HTTPException(status_code=400, detail="GeoJSON has no features.")
-        if not gdf.geom_type.str.contains("polygon", case=False, na=False).any():
+        if not gdf.geom_type.isin(POLYGON_TYPES).any():
             raise HTTPException(status_code=400, detail="Only polygon geometries are supported.")
         _validate_geo_limits(gdf)
 
@@ -618,8 +776,8 @@ async def analyze_geojson(payload: GeoJSONPayload):
 
         _ensure_within_coverage(gdf)
 
-        shp_path = upload_dir / "drawn.shp"
-        gdf.to_file(shp_path, driver="ESRI Shapefile", index=False)
+        shp_path = upload_dir / "drawn.gpkg"
+        gdf.to_file(shp_path, driver="GPKG", index=False, engine=GEO_IO_ENGINE)
         outputs = _run_analyzer(shp_path, run_dir, payload.lang)
         return {
             "runId": run_id,